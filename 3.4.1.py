@@ -3,6 +3,8 @@ from datetime import datetime
 from dateutil.relativedelta import relativedelta
 from xml.etree import ElementTree
 import requests
+
+from DateParser import parse_datetime
 from statistics import mean
 
 
@@ -54,7 +56,7 @@ class DataSet:
         """
         for x in date_interval:
             if self.dataframe_sort['salary_currency'][x] in self.dict_of_amount:
-                return datetime.strptime(self.dataframe_sort['published_at'][x], '%Y-%m-%dT%H:%M:%S%z').date()
+                return parse_datetime(self.dataframe_sort['published_at'][x]).date()
 
 
 class DataSetCurrency:
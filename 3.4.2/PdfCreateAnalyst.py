@@ -48,8 +48,8 @@ class DataSetConverter:
         Returns:
             str or float: Возвращает значение зарплаты или 'nan',если значения недопустимы
         """
-        salary_in_foreign_currency = str(row[2])
-        list_of_salary = list(filter(lambda x: str(x) != 'nan', row[:2]))
+        salary_in_foreign_currency = str(row.iloc[2])
+        list_of_salary = list(filter(lambda x: str(x) != 'nan', row.iloc[:2]))
         if salary_in_foreign_currency == 'nan':
             return 'nan'
         if len(list_of_salary) != 0:
@@ -57,7 +57,7 @@ class DataSetConverter:
         else:
             return 'nan'
         if salary_in_foreign_currency != 'RUR' and salary_in_foreign_currency in self.exchange_rates:
-            multiplier = self.currency_dataframe[self.currency_dataframe['date'] == str(row[3])[:7]][salary_in_foreign_currency].iat[0]
+            multiplier = self.currency_dataframe[self.currency_dataframe['date'] == str(row.iloc[3])[:7]][salary_in_foreign_currency].iat[0]
             convert_salary = multiplier * convert_salary
         return convert_salary
 
@@ -72,7 +72,7 @@ class SplittingCSV:
             file_name (str): Имя исходного файла в формате .csv
         """
         self.dataframe = pd.read_csv(file_name)
-        self.dataframe["years"] = self.dataframe["published_at"].apply(lambda x: int(".".join(x[:4].split("-"))))
+        self.dataframe["years"] = self.dataframe["published_at"].str.slice(0, 4).astype(int)
         self.years = list(self.dataframe["years"].unique())
 
         for x in self.years:
@@ -49,8 +49,8 @@ class DataSetConverter:
         Returns:
             str or float: Возвращает значение зарплаты или 'nan',если значения недопустимы
         """
-        salary_in_foreign_currency = str(row[2])
-        list_of_salary = list(filter(lambda x: str(x) != 'nan', row[:2]))
+        salary_in_foreign_currency = str(row.iloc[2])
+        list_of_salary = list(filter(lambda x: str(x) != 'nan', row.iloc[:2]))
         if salary_in_foreign_currency == 'nan':
             return 'nan'
         if len(list_of_salary) != 0:
@@ -59,7 +59,7 @@ class DataSetConverter:
             return 'nan'
         if salary_in_foreign_currency != 'RUR' and salary_in_foreign_currency in self.exchange_rates:
             multiplier = \
-            self.currency_dataframe[self.currency_dataframe['date'] == str(row[3])[:7]][salary_in_foreign_currency].iat[
+            self.currency_dataframe[self.currency_dataframe['date'] == str(row.iloc[3])[:7]][salary_in_foreign_currency].iat[
                 0]
             convert_salary = multiplier * convert_salary
         return convert_salary
@@ -76,7 +76,7 @@ class SplittingCSV:
             file_name (str): Имя исходного файла в формате .csv
         """
         self.dataframe = pd.read_csv(file_name)
-        self.dataframe["years"] = self.dataframe["published_at"].apply(lambda x: int(".".join(x[:4].split("-"))))
+        self.dataframe["years"] = self.dataframe["published_at"].str.slice(0, 4).astype(int)
         self.years = list(self.dataframe["years"].unique())
 
         for x in self.years:
@@ -192,7 +192,7 @@ if __name__ == '__main__':
     dataframe = pd.read_csv(file)
     exchange_rate = pd.read_csv('exchange_rate_currency.csv')
 
-    dataframe["years"] = dataframe["published_at"].apply(lambda date: int(".".join(date[:4].split("-"))))
+    dataframe["years"] = dataframe["published_at"].str.slice(0, 4).astype(int)
     years_list = list(dataframe["years"].unique())
     area_salary, area_vacancy, vacancy_of_profession_salary, vacancy_of_profession_count = {}, {}, {}, {}
     dataframe = DataSetConverter(dataframe, exchange_rate).data_set_converter_create_csv()
@@ -0,0 +1,70 @@
+import importlib.util
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+directory = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(directory))
+
+from data_generator import generate_exchange_rates, generate_vacancies
+
+
+def load_converter():
+    """ Метод для загрузки класса DataSetConverter из data_base_3.5.2.py
+
+    Returns:
+        type: Класс DataSetConverter
+    """
+    spec = importlib.util.spec_from_file_location('data_base_3_5_2', os.path.join(directory, 'data_base_3.5.2.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.DataSetConverter
+
+
+def run(converter, bulk):
+    """ Метод для перевода зарплат выбранным способом
+
+    Args:
+        converter (type): Класс DataSetConverter
+        bulk (bool): Переводить одним SQL-запросом
+
+    Returns:
+        tuple: Время в секундах и содержимое csv_result.csv
+    """
+    start = time.perf_counter()
+    converter(pd.read_csv('vacancies_dif_currencies.csv')).data_set_converter_create_csv(bulk)
+    seconds = time.perf_counter() - start
+    with open('csv_result.csv', encoding='utf_8') as file:
+        return seconds, file.read()
+
+
+def convert_benchmark(rows):
+    """ Метод для сравнения перевода зарплат одним SQL-запросом и отдельным запросом на каждую вакансию
+    на синтетических данных
+
+    Args:
+        rows (int): Количество вакансий
+    """
+    converter = load_converter()
+    with tempfile.TemporaryDirectory() as work_dir:
+        os.chdir(work_dir)
+        generate_vacancies('vacancies_dif_currencies.csv', rows)
+        generate_exchange_rates('exchange_rate_currency.csv')
+        with sqlite3.connect('data_base_3.5.1.sqlite') as connect:
+            pd.read_csv('exchange_rate_currency.csv').to_sql(name='data_base_3.5.1.sqlite', con=connect,
+                                                             if_exists='replace', index=False)
+        bulk_seconds, bulk_result = run(converter, True)
+        row_seconds, row_result = run(converter, False)
+        os.chdir(directory)
+    print(f'Вакансий: {rows}')
+    print(f'По запросу на вакансию: {row_seconds:.2f} с')
+    print(f'Одним запросом: {bulk_seconds:.2f} с')
+    print(f'Результаты совпадают: {"да" if bulk_result == row_result else "нет"}')
+
+
+if __name__ == '__main__':
+    convert_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -21,16 +21,60 @@ class DataSetConverter:
         self.currencies = list(pd.read_sql("select * from 'data_base_3.5.1.sqlite'", self.currency_data_base).keys()[1:])
 
 
-    def data_set_converter_create_csv(self):
+    def data_set_converter_create_csv(self, bulk=True):
         """ Метод для создания файла в формате .csv, содержащим данные с обработанными вакансиями,
         у которых зарплата переведена по курсу валют
+
+        Attributes:
+            bulk (bool): Переводить все зарплаты одним SQL-запросом, иначе по одному запросу на вакансию
         """
         self.dataframe.insert(1, 'salary', None)
-        self.dataframe['salary'] = self.dataframe[['salary_from', 'salary_to', 'salary_currency', 'published_at']].apply(self.convert_salary, axis=1)
+        if bulk:
+            self.dataframe['salary'] = self.convert_salaries()
+        else:
+            self.dataframe['salary'] = self.dataframe[['salary_from', 'salary_to', 'salary_currency', 'published_at']].apply(self.convert_salary, axis=1)
         self.dataframe.drop(labels=['salary_to', 'salary_from', 'salary_currency'], axis=1, inplace=True)
-        self.dataframe = self.dataframe.loc[self.dataframe['salary'] != 'nan']
+        self.dataframe = self.dataframe.loc[self.dataframe['salary'].notna() & (self.dataframe['salary'] != 'nan')]
         self.dataframe.to_csv('csv_result.csv', index=False)
 
+    def convert_salaries(self):
+        """ Метод для перевода зарплат всех вакансий в рубли одной операцией в базе данных.
+        Вакансии загружаются во временную таблицу, курсы - во временную таблицу (месяц, валюта, курс)
+        с первичным ключом по месяцу и валюте, после чего зарплаты считаются одним запросом с JOIN.
+        Правила те же, что в convert_salary, вместо 'nan' возвращается NULL
+
+        Returns:
+            Series: Зарплаты вакансий в рублях
+        """
+        connect = self.currency_data_base
+        currencies = [currency for currency in self.currencies if currency != 'RUR']
+        connect.execute("DROP TABLE IF EXISTS temp.rates")
+        connect.execute("CREATE TEMP TABLE rates (month TEXT, currency TEXT, rate REAL, PRIMARY KEY (month, currency)) WITHOUT ROWID")
+        for currency in currencies:
+            connect.execute(f'INSERT OR IGNORE INTO temp.rates SELECT date, ?, "{currency}" FROM "data_base_3.5.1.sqlite"', (currency,))
+        connect.execute("DROP TABLE IF EXISTS temp.vacancies")
+        connect.execute("CREATE TEMP TABLE vacancies (row_id INTEGER PRIMARY KEY, salary_from REAL, salary_to REAL, salary_currency TEXT, month TEXT)")
+        staging = pd.DataFrame({'salary_from': self.dataframe['salary_from'].astype(float),
+                                'salary_to': self.dataframe['salary_to'].astype(float),
+                                'salary_currency': self.dataframe['salary_currency'],
+                                'month': self.dataframe['published_at'].astype(str).str.slice(0, 7)})
+        staging = staging.astype(object).where(staging.notna(), None)
+        connect.executemany("INSERT INTO temp.vacancies VALUES (?, ?, ?, ?, ?)", staging.reset_index(drop=True).itertuples(name=None))
+        placeholders = ', '.join('?' * len(currencies))
+        salaries = pd.read_sql(f"""
+            SELECT CASE
+                WHEN v.salary_currency IS NULL OR (v.salary_from IS NULL AND v.salary_to IS NULL) THEN NULL
+                ELSE CASE
+                    WHEN v.salary_from IS NULL THEN v.salary_to
+                    WHEN v.salary_to IS NULL THEN v.salary_from
+                    ELSE (v.salary_from + v.salary_to) / 2.0
+                END * CASE WHEN v.salary_currency IN ({placeholders}) THEN r.rate ELSE 1 END
+            END AS salary
+            FROM temp.vacancies v LEFT JOIN temp.rates r ON r.month = v.month AND r.currency = v.salary_currency
+            ORDER BY v.row_id""", connect, params=currencies)['salary']
+        connect.execute("DROP TABLE temp.vacancies")
+        return salaries.set_axis(self.dataframe.index)
+
 
     def convert_salary(self, row):
         """ Метод для получения значения зарплаты по вакансии, переведенной в рубли по курсу валют.
@@ -41,8 +85,8 @@ class DataSetConverter:
         Returns:
             str or float: Возвращает значение зарплаты или 'nan',если значения недопустимы
         """
-        salary_currency = str(row[2])
-        salary_list = list(filter(lambda x: str(x) != 'nan', row[:2]))
+        salary_currency = str(row.iloc[2])
+        salary_list = list(filter(lambda x: str(x) != 'nan', row.iloc[:2]))
         if salary_currency == 'nan':
             return 'nan'
 
@@ -52,7 +96,7 @@ class DataSetConverter:
             return 'nan'
 
         if salary_currency != 'RUR' and salary_currency in self.currencies:
-            multiplier = pd.read_sql(f"select {salary_currency} from 'data_base_3.5.1.sqlite' where date='{str(row[3])[:7]}'", self.currency_data_base)[f'{salary_currency}'][0]
+            multiplier = pd.read_sql(f"select {salary_currency} from 'data_base_3.5.1.sqlite' where date='{str(row.iloc[3])[:7]}'", self.currency_data_base)[f'{salary_currency}'][0]
             if multiplier is not None:
                 salary *= multiplier
             else:
@@ -71,4 +115,6 @@ class DataSetConverter:
         connect.commit()
 
 
-DataSetConverter(pd.read_csv('vacancies_dif_currencies.csv')).csv_to_vacancy_sql('data_base_3.5.2.sqlite')
\ No newline at end of file
+
+if __name__ == '__main__':
+    DataSetConverter(pd.read_csv('vacancies_dif_currencies.csv')).csv_to_vacancy_sql('data_base_3.5.2.sqlite')
\ No newline at end of file
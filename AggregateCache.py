@@ -0,0 +1,104 @@
+import hashlib
+import json
+import os
+
+
+class AggregateCache:
+    """Дисковый кэш результатов анализа, привязанный к отпечатку исходного файла.
+    Отпечаток складывается из пути, размера, времени изменения и хэша содержимого файла.
+    Общий размер кэша ограничен, при переполнении удаляются давно не использованные записи.
+    Записи хранятся в JSON, поэтому загрузка записи из чужой папки не может выполнить код
+
+    Attributes:
+        cache_dir (str): Папка кэша
+        max_size (int): Максимальный размер кэша в байтах
+    """
+    def __init__(self, cache_dir='pdf_cache', max_size=512 * 1024 * 1024):
+        """Инициализирует объекты AggregateCache
+
+        Args:
+            cache_dir (str): Папка кэша
+            max_size (int): Максимальный размер кэша в байтах
+        """
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+
+    @staticmethod
+    def get_fingerprint(file_name, block_size=1024 * 1024):
+        """Вычисляет отпечаток файла
+
+        Args:
+            file_name (str): Название файла
+            block_size (int): Размер читаемого блока в байтах
+
+        Returns:
+            str: Отпечаток файла
+        """
+        stat = os.stat(file_name)
+        content_hash = hashlib.blake2b()
+        with open(file_name, 'rb') as file:
+            while block := file.read(block_size):
+                content_hash.update(block)
+        fingerprint = hashlib.blake2b(digest_size=20)
+        for part in [os.path.abspath(file_name), stat.st_size, stat.st_mtime_ns, content_hash.hexdigest()]:
+            fingerprint.update(f'{part}\0'.encode())
+        return fingerprint.hexdigest()
+
+    def get_path(self, fingerprint):
+        """Возвращает путь к записи кэша
+
+        Args:
+            fingerprint (str): Отпечаток исходного файла
+
+        Returns:
+            str: Путь к записи кэша
+        """
+        return os.path.join(self.cache_dir, f'{fingerprint}.json')
+
+    def load(self, fingerprint):
+        """Загружает запись кэша
+
+        Args:
+            fingerprint (str): Отпечаток исходного файла
+
+        Returns:
+            any: Сохранённые данные или None, если записи нет
+        """
+        path = self.get_path(fingerprint)
+        try:
+            with open(path, encoding='utf_8') as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return None
+        os.utime(path)
+        return data
+
+    def save(self, fingerprint, data):
+        """Сохраняет данные в кэш и освобождает место под ограничение размера
+
+        Args:
+            fingerprint (str): Отпечаток исходного файла
+            data (any): Сохраняемые данные, представимые в JSON
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self.get_path(fingerprint)
+        with open(f'{path}.tmp', 'w', encoding='utf_8') as file:
+            json.dump(data, file, ensure_ascii=False)
+        os.replace(f'{path}.tmp', path)
+        self.evict()
+
+    def evict(self):
+        """Удаляет самые давно использованные записи, пока кэш больше max_size
+
+        """
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith('.json'):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        size = sum(entry[1] for entry in entries)
+        for _, entry_size, path in sorted(entries):
+            if size <= self.max_size:
+                break
+            os.remove(path)
+            size -= entry_size
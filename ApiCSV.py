@@ -1,8 +1,9 @@
 import pandas as pd
-from datetime import datetime
 from dateutil.relativedelta import relativedelta
-from xml.etree import ElementTree
-import requests
+
+from CbrRates import AsyncRateFetcher
+from DateParser import parse_datetime
+from RateStore import RateStore
 
 
 class DataSet:
@@ -53,7 +54,7 @@ class DataSet:
         """
         for x in date_interval:
             if self.dataframe_sort['salary_currency'][x] in self.dict_of_amount:
-                return datetime.strptime(self.dataframe_sort['published_at'][x], '%Y-%m-%dT%H:%M:%S%z').date()
+                return parse_datetime(self.dataframe_sort['published_at'][x]).date()
 
 
 class DataSetCurrency:
@@ -86,30 +87,23 @@ class DataSetCurrency:
             start_date = start_date + relativedelta(months=1)
         return result_date_list
 
-    def get_currency_in_csv(self, currency_list, start_date, end_date):
+    def get_currency_in_csv(self, currency_list, start_date, end_date, fetcher=None, store=None):
         """ Метод формирования файла с курсами валют в зависимости от даты в формате .csv
         Args:
             currency_list (list): Список рассматриваемых валют
             start_date (datetime.date): Начальная дата
             end_date (datetime.date): Конечная дата
+            fetcher (AsyncRateFetcher): Загрузчик курсов, по умолчанию с сайта ЦБ РФ
+            store (RateStore): Хранилище уже загруженных курсов, по умолчанию exchange_rates.sqlite
         """
-        currency_dataframe = pd.DataFrame(columns=['date'] + currency_list)
+        if fetcher is None:
+            fetcher = AsyncRateFetcher()
         dates_list = self.get_year_interval(start_date, end_date)
-        for date in dates_list:
-            answer = requests.get(f'https://www.cbr.ru/scripts/XML_daily.asp?date_req=01/{date}d=1')
-            answer = ElementTree.fromstring(answer.content.decode("WINDOWS-1251"))
-            currency_dict = {x: '' for x in currency_list}
-            for x in answer.findall('./Valute'):
-                if x.find('./CharCode').text in currency_list:
-                    currency_dict[x.find('./CharCode').text] = \
-                        round(float(x.find('./Value').text.replace(',', '.')) /
-                              int(x.find('./Nominal').text), 4)
-                    if all(currency_dict.values()):
-                        break
-            currency_dict = sorted(currency_dict.items(), key=lambda x: x[0])
-            current_course = [x[1] for x in currency_dict]
-            currency_dataframe.loc[len(currency_dataframe.index)] = [datetime.strptime(date, '%m/%Y').strftime('%Y-%m')] \
-                                                                    + current_course
+        rate_store = store or RateStore()
+        fetched = rate_store.update(fetcher, dates_list, currency_list)
+        currency_dataframe = rate_store.get_rates(dates_list, currency_list, fetched)
+        if store is None:
+            rate_store.close()
         currency_dataframe.to_csv('exchange_rate_currency.csv', index=False)
 
 
@@ -1,9 +1,9 @@
 import pandas as pd
-from datetime import datetime
 from dateutil.relativedelta import relativedelta
-from xml.etree import ElementTree
-import requests
-from statistics import mean
+
+from CbrRates import AsyncRateFetcher
+from DateParser import parse_datetime, parse_months
+from RateStore import RateStore
 
 
 class DataSet:
@@ -54,7 +54,7 @@ class DataSet:
         """
         for x in date_interval:
             if self.dataframe_sort['salary_currency'][x] in self.dict_of_amount:
-                return datetime.strptime(self.dataframe_sort['published_at'][x], '%Y-%m-%dT%H:%M:%S%z').date()
+                return parse_datetime(self.dataframe_sort['published_at'][x]).date()
 
 
 class DataSetCurrency:
@@ -87,32 +87,25 @@ class DataSetCurrency:
             start_date = start_date + relativedelta(months=1)
         return result_date_list
 
-    def get_currency_in_csv(self, currency_list, start_date, end_date):
+    def get_currency_in_csv(self, currency_list, start_date, end_date, fetcher=None, store=None):
         """ Метод формирования файла с курсами валют в зависимости от даты в формате .csv
         Args:
             currency_list (list): Список рассматриваемых валют
             start_date (datetime.date): Начальная дата
             end_date (datetime.date): Конечная дата
+            fetcher (AsyncRateFetcher): Загрузчик курсов, по умолчанию с сайта ЦБ РФ
+            store (RateStore): Хранилище уже загруженных курсов, по умолчанию exchange_rates.sqlite
         Returns:
             DataFrame: Возвращает фрагмент с курсами валют в разные годы
         """
-        currency_dataframe = pd.DataFrame(columns=['date'] + currency_list)
+        if fetcher is None:
+            fetcher = AsyncRateFetcher()
         dates_list = self.get_year_interval(start_date, end_date)
-        for date in dates_list:
-            answer = requests.get(f'https://www.cbr.ru/scripts/XML_daily.asp?date_req=01/{date}d=1')
-            answer = ElementTree.fromstring(answer.content.decode("WINDOWS-1251"))
-            currency_dict = {x: '' for x in currency_list}
-            for x in answer.findall('./Valute'):
-                if x.find('./CharCode').text in currency_list:
-                    currency_dict[x.find('./CharCode').text] = \
-                        round(float(x.find('./Value').text.replace(',', '.')) /
-                              int(x.find('./Nominal').text), 4)
-                    if all(currency_dict.values()):
-                        break
-            currency_dict = sorted(currency_dict.items(), key=lambda x: x[0])
-            current_course = [x[1] for x in currency_dict]
-            currency_dataframe.loc[len(currency_dataframe.index)] = [datetime.strptime(date, '%m/%Y').strftime('%Y-%m')] \
-                                                                    + current_course
+        rate_store = store or RateStore()
+        fetched = rate_store.update(fetcher, dates_list, currency_list)
+        currency_dataframe = rate_store.get_rates(dates_list, currency_list, fetched)
+        if store is None:
+            rate_store.close()
         currency_dataframe.to_csv('exchange_rate_currency.csv', index=False)
         return currency_dataframe
 
@@ -141,39 +134,46 @@ class DataSetConverter:
         у которых зарплата переведена по курсу валют
 
         """
-        self.dataframe.insert(1, 'salary', None)
-        self.dataframe['salary'] = self.dataframe[['salary_from', 'salary_to', 'salary_currency', 'published_at']].apply(self.convert_salary, axis=1)
-        self.dataframe.drop(labels=['salary_to', 'salary_from', 'salary_currency'], axis=1, inplace=True)
-        self.dataframe = self.dataframe.loc[self.dataframe['salary'] != 'nan']
+        self.dataframe.insert(1, 'salary', self.convert_salary(self.dataframe))
+        self.dataframe = self.dataframe.loc[self.dataframe['salary_currency'].notna() &
+                                            self.dataframe[['salary_from', 'salary_to']].notna().any(axis=1)]
+        self.dataframe = self.dataframe.drop(labels=['salary_to', 'salary_from', 'salary_currency'], axis=1)
         self.dataframe.to_csv('exchange_rate_currency_convert.csv', index=False)
 
-    def convert_salary(self, row):
-        """ Метод для получения значения зарплаты по вакансии, переведенной в рубли по курсу валют.
-        Если значения недопустимы, функция отсанавливается и возвращает 'nan'.
+    def get_rates(self):
+        """ Метод для получения курсов валют в виде таблицы (месяц, валюта) -> курс
+
+        Returns:
+            Series: Курсы валют с индексом из месяца и кода валюты
+        """
+        rates = self.currency_dataframe.melt(id_vars='date', value_vars=self.exchange_rates,
+                                             var_name='salary_currency', value_name='rate')
+        rates['rate'] = pd.to_numeric(rates['rate'], errors='coerce')
+        return rates.drop_duplicates(['date', 'salary_currency']).set_index(['date', 'salary_currency'])['rate']
+
+    def convert_salary(self, dataframe):
+        """ Метод для получения зарплат всех вакансий, переведённых в рубли по курсу валют месяца публикации.
+        Средняя зарплата считается по указанным границам вилки, курс берётся одним соединением
+        вакансий с таблицей курсов. Если валюта или обе границы не указаны, зарплата - NaN
 
         Args:
-            row (pd.Series): Строка рассматриваемой вакансии из DataFrame
+            dataframe (DataFrame): Фрейм с данными о вакансиях
 
         Returns:
-            str or float: Возвращает значение зарплаты или 'nan',если значения недопустимы
+            Series: Зарплаты вакансий в рублях
         """
-        salary_in_foreign_currency = str(row[2])
-        list_of_salary = list(filter(lambda x: str(x) != 'nan', row[:2]))
-        if salary_in_foreign_currency == 'nan':
-            return 'nan'
-
-        if len(list_of_salary) != 0:
-            convert_salary = mean(list_of_salary)
-        else:
-            return 'nan'
-
-        if salary_in_foreign_currency != 'RUR' and salary_in_foreign_currency in self.exchange_rates:
-            multiplier = self.currency_dataframe[self.currency_dataframe['date'] == str(row[3])[:7]][salary_in_foreign_currency].iat[0]
-            convert_salary *= multiplier
-        return convert_salary
-
-
-data_set = DataSet('vacancies_dif_currencies.csv')
-data_set_currency = DataSetCurrency(data_set.dataframe_sort)
-data_set_currency_csv = data_set_currency.get_currency_in_csv(list(data_set.dict_of_amount.keys()), data_set.older_date, data_set.newest_date)
-DataSetConverter(data_set.dataframe_sort, data_set_currency_csv).data_set_converter_create_csv()
+        salary = dataframe[['salary_from', 'salary_to']].astype(float).mean(axis=1)
+        salary = salary.where(dataframe['salary_currency'].notna())
+        months = parse_months(dataframe['published_at'].astype(str))
+        keys = pd.MultiIndex.from_arrays([months, dataframe['salary_currency']])
+        multiplier = self.get_rates().reindex(keys).to_numpy()
+        converted = dataframe['salary_currency'].isin(self.exchange_rates) & (dataframe['salary_currency'] != 'RUR')
+        return salary.where(~converted, salary * multiplier)
+
+
+if __name__ == '__main__':
+    data_set = DataSet('vacancies_dif_currencies.csv')
+    data_set_currency = DataSetCurrency(data_set.dataframe_sort)
+    data_set_currency_csv = data_set_currency.get_currency_in_csv(list(data_set.dict_of_amount.keys()),
+                                                                  data_set.older_date, data_set.newest_date)
+    DataSetConverter(data_set.dataframe_sort, data_set_currency_csv).data_set_converter_create_csv()
@@ -0,0 +1,64 @@
+import math
+import os
+import tempfile
+from statistics import mean
+from unittest import TestCase
+
+import pandas as pd
+
+from ApiCSVConvert import DataSetConverter
+
+
+# Построчный перевод, как до векторизации: среднее указанных границ, курс месяца публикации,
+# валюты без курса в фрейме не переводятся, отсутствующий курс даёт NaN
+def convert_row(row, rates, exchange_rates):
+    salaries = [x for x in (row['salary_from'], row['salary_to']) if not math.isnan(x)]
+    if pd.isna(row['salary_currency']) or len(salaries) == 0:
+        return math.nan
+    salary = mean(salaries)
+    if row['salary_currency'] != 'RUR' and row['salary_currency'] in exchange_rates:
+        month = rates[rates['date'] == row['published_at'][:7]]
+        if len(month) == 0 or month[row['salary_currency']].iat[0] == '':
+            return math.nan
+        salary *= month[row['salary_currency']].iat[0]
+    return salary
+
+
+class ConvertSalaryTests(TestCase):
+    def setUp(self):
+        self.rates = pd.DataFrame([['2022-01', 0.2, 90.0, 0.2, 75.0], ['2022-02', 0.2, 85.0, '', 80.0]],
+                                  columns=['date', 'AZN', 'EUR', 'KZT', 'USD'])
+        self.vacancies = pd.DataFrame([
+            ['Программист', 100000.0, 200000.0, 'RUR', 'Москва', '2022-01-10T10:00:00+0300'],
+            ['Программист', None, 2000.0, 'USD', 'Москва', '2022-02-01T00:00:00+0300'],
+            ['Аналитик', 1000.0, None, 'EUR', 'Тула', '2022-01-31T23:59:59+0300'],
+            ['Аналитик', None, None, 'EUR', 'Тула', '2022-01-05T10:00:00+0300'],
+            ['Тестировщик', 5000.0, 7000.0, None, 'Казань', '2022-02-05T10:00:00+0300'],
+            ['Тестировщик', 100000.0, 300000.0, 'KZT', 'Казань', '2022-02-05T10:00:00+0300'],
+            ['Тестировщик', 100000.0, 300000.0, 'KZT', 'Казань', '2022-01-05T10:00:00+0300'],
+            ['Программист', 500.0, 700.0, 'AZN', 'Баку', '2022-01-05T10:00:00+0300'],
+            ['Программист', 500.0, 700.0, 'UAH', 'Киев', '2022-02-05T10:00:00+0300'],
+            ['Программист', 1000.0, 3000.0, 'USD', 'Москва', '2022-03-05T10:00:00+0300'],
+        ], columns=['name', 'salary_from', 'salary_to', 'salary_currency', 'area_name', 'published_at'])
+
+    def test_same_as_row_wise(self):
+        converter = DataSetConverter(self.vacancies.copy(), self.rates)
+        expected = [convert_row(row, self.rates, converter.exchange_rates) for _, row in self.vacancies.iterrows()]
+        result = converter.convert_salary(self.vacancies).tolist()
+        self.assertEqual(converter.exchange_rates, ['EUR', 'KZT', 'USD'])
+        self.assertEqual([None if math.isnan(x) else x for x in result],
+                         [None if math.isnan(x) else x for x in expected])
+        self.assertEqual(result[:3], [150000.0, 160000.0, 90000.0])
+
+    def test_create_csv(self):
+        directory = os.getcwd()
+        with tempfile.TemporaryDirectory() as work_dir:
+            os.chdir(work_dir)
+            try:
+                DataSetConverter(self.vacancies.copy(), self.rates).data_set_converter_create_csv()
+                result = pd.read_csv('exchange_rate_currency_convert.csv')
+            finally:
+                os.chdir(directory)
+        self.assertEqual(list(result.columns), ['name', 'salary', 'area_name', 'published_at'])
+        self.assertEqual(len(result), 8)
+        self.assertEqual(result['salary'].iloc[[5, 6]].tolist(), [600.0, 600.0])
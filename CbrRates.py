@@ -0,0 +1,246 @@
+import asyncio
+import io
+from bisect import bisect_right
+from datetime import datetime
+from xml.etree import ElementTree
+
+import pandas as pd
+import requests
+from dateutil.relativedelta import relativedelta
+from requests.adapters import HTTPAdapter
+
+daily_url = 'https://www.cbr.ru/scripts/XML_daily.asp'
+dynamic_url = 'https://www.cbr.ru/scripts/XML_dynamic.asp'
+codes_url = 'https://www.cbr.ru/scripts/XML_valFull.asp'
+
+
+def parse_daily(content, currency_list):
+    """ Метод разбора ответа XML_daily.asp: курс каждой валюты за единицу номинала
+
+    Args:
+        content (bytes): Ответ сервера в кодировке windows-1251
+        currency_list (list): Коды нужных валют
+
+    Returns:
+        dict: Словарь код валюты:курс, '' если валюты нет в ответе
+
+    >>> parse_daily('<ValCurs><Valute><CharCode>KZT</CharCode><Nominal>100</Nominal><Value>16,2301</Value></Valute>'
+    ...             '</ValCurs>'.encode('windows-1251'), ['KZT', 'USD'])
+    {'KZT': 0.1623, 'USD': ''}
+    """
+    answer = ElementTree.fromstring(content.decode("WINDOWS-1251"))
+    currency_dict = {x: '' for x in currency_list}
+    for x in answer.findall('./Valute'):
+        if x.find('./CharCode').text in currency_list:
+            currency_dict[x.find('./CharCode').text] = \
+                round(float(x.find('./Value').text.replace(',', '.')) / int(x.find('./Nominal').text), 4)
+            if all(currency_dict.values()):
+                break
+    return currency_dict
+
+
+def parse_codes(content):
+    """ Метод потокового разбора справочника валют XML_valFull.asp
+
+    Args:
+        content (bytes): Ответ сервера в кодировке windows-1251
+
+    Returns:
+        dict: Словарь код валюты:внутренний код ЦБ РФ
+
+    >>> parse_codes('<Valuta><Item ID="R01235"><ISO_Char_Code>USD</ISO_Char_Code></Item>'
+    ...             '</Valuta>'.encode('windows-1251'))
+    {'USD': 'R01235'}
+    """
+    codes = {}
+    for event, element in ElementTree.iterparse(io.BytesIO(content)):
+        if element.tag == 'Item':
+            if element.findtext('ISO_Char_Code'):
+                codes[element.findtext('ISO_Char_Code')] = element.get('ID')
+            element.clear()
+    return codes
+
+
+def parse_dynamic(content):
+    """ Метод потокового разбора ответа XML_dynamic.asp: курс одной валюты за период
+
+    Args:
+        content (bytes): Ответ сервера в кодировке windows-1251
+
+    Returns:
+        list: Пары (дата начала действия курса, курс за единицу номинала) по возрастанию даты
+
+    >>> parse_dynamic('<ValCurs><Record Date="31.12.2002"><Nominal>10</Nominal><Value>318,44</Value></Record>'
+    ...               '</ValCurs>'.encode('windows-1251'))
+    [(datetime.date(2002, 12, 31), 31.844)]
+    """
+    records = []
+    for event, element in ElementTree.iterparse(io.BytesIO(content)):
+        if element.tag == 'Record':
+            records.append((datetime.strptime(element.get('Date'), '%d.%m.%Y').date(),
+                            round(float(element.findtext('Value').replace(',', '.')) /
+                                  int(element.findtext('Nominal')), 4)))
+            element.clear()
+    return sorted(records)
+
+
+class AsyncRateFetcher:
+    """ Класс для параллельной загрузки курсов валют ЦБ РФ на первое число месяцев.
+    Запросы выполняются через asyncio с ограничением числа одновременных запросов,
+    соединения переиспользуются общей сессией, неудачные запросы повторяются с растущей паузой
+
+    Attributes:
+        url (str): Адрес XML_daily.asp
+        concurrency (int): Максимальное число одновременных запросов
+        retries (int): Количество повторов неудачного запроса
+        backoff (float): Пауза перед первым повтором в секундах, дальше удваивается
+        timeout (float): Таймаут запроса в секундах
+    """
+    def __init__(self, url=daily_url, concurrency=8, retries=3, backoff=0.5, timeout=10):
+        """ Инициализирует класс AsyncRateFetcher
+
+        Args:
+            url (str): Адрес XML_daily.asp
+            concurrency (int): Максимальное число одновременных запросов
+            retries (int): Количество повторов неудачного запроса
+            backoff (float): Пауза перед первым повтором в секундах
+            timeout (float): Таймаут запроса в секундах
+        """
+        self.url = url
+        self.concurrency = concurrency
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+
+    def create_session(self):
+        """ Метод создания сессии с пулом соединений на concurrency соединений
+
+        Returns:
+            Session: Сессия requests
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.concurrency)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    async def fetch(self, session, semaphore, params, url=None):
+        """ Метод выполнения одного запроса с повторами
+
+        Args:
+            session (Session): Сессия requests
+            semaphore (Semaphore): Ограничение числа одновременных запросов
+            params (dict): Параметры запроса
+            url (str): Адрес запроса, по умолчанию url загрузчика
+
+        Returns:
+            bytes: Тело ответа
+        """
+        async with semaphore:
+            for attempt in range(self.retries + 1):
+                try:
+                    response = await asyncio.to_thread(session.get, url or self.url, params=params,
+                                                       timeout=self.timeout)
+                    response.raise_for_status()
+                    return response.content
+                except requests.RequestException:
+                    if attempt == self.retries:
+                        raise
+                await asyncio.sleep(self.backoff * 2 ** attempt)
+
+    async def fetch_all(self, params_list, url=None):
+        """ Метод выполнения всех запросов. Ответы возвращаются в порядке запросов
+
+        Args:
+            params_list (list[dict]): Параметры запросов
+            url (str): Адрес запросов, по умолчанию url загрузчика
+
+        Returns:
+            list[bytes]: Тела ответов
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        with self.create_session() as session:
+            return await asyncio.gather(*(self.fetch(session, semaphore, params, url) for params in params_list))
+
+    def get_rates(self, dates_list, currency_list):
+        """ Метод получения курсов валют на первое число каждого месяца
+
+        Args:
+            dates_list (list): Месяцы в формате 'MM/YYYY'
+            currency_list (list): Коды валют
+
+        Returns:
+            DataFrame: Фрейм с месяцем в формате 'YYYY-MM' и курсами валют
+        """
+        contents = asyncio.run(self.fetch_all([{'date_req': f'01/{date}'} for date in dates_list]))
+        rows = []
+        for date, content in zip(dates_list, contents):
+            currency_dict = parse_daily(content, currency_list)
+            rows.append([datetime.strptime(date, '%m/%Y').strftime('%Y-%m')] +
+                        [currency_dict[x] for x in currency_list])
+        return pd.DataFrame(rows, columns=['date'] + currency_list)
+
+
+class RangeRateFetcher(AsyncRateFetcher):
+    """ Класс для загрузки курсов валют ЦБ РФ на первое число месяцев по истории каждой валюты.
+    Вместо запроса XML_daily.asp на каждый месяц выполняется один запрос справочника валют
+    и по одному запросу XML_dynamic.asp на валюту за весь период, поэтому число запросов
+    зависит от количества валют, а не месяцев. Курс на первое число - последний курс,
+    действующий с этой даты или раньше, как в ответе XML_daily.asp
+
+    Attributes:
+        url (str): Адрес XML_dynamic.asp
+        codes_url (str): Адрес справочника валют XML_valFull.asp
+    """
+    def __init__(self, url=dynamic_url, codes_url=codes_url, **kwargs):
+        """ Инициализирует класс RangeRateFetcher
+
+        Args:
+            url (str): Адрес XML_dynamic.asp
+            codes_url (str): Адрес справочника валют XML_valFull.asp
+            **kwargs: Параметры AsyncRateFetcher
+        """
+        super().__init__(url, **kwargs)
+        self.codes_url = codes_url
+
+    async def fetch_history(self, currency_list, start_date, end_date):
+        """ Метод загрузки истории курсов валют за период
+
+        Args:
+            currency_list (list): Коды валют
+            start_date (datetime): Начало периода
+            end_date (datetime): Конец периода
+
+        Returns:
+            dict: Словарь код валюты:список пар (дата, курс), валюты без кода в справочнике пропускаются
+        """
+        codes = parse_codes((await self.fetch_all([{}], self.codes_url))[0])
+        currency_list = [x for x in currency_list if x in codes]
+        contents = await self.fetch_all([{'date_req1': start_date.strftime('%d/%m/%Y'),
+                                          'date_req2': end_date.strftime('%d/%m/%Y'),
+                                          'VAL_NM_RQ': codes[x]} for x in currency_list])
+        return {x: parse_dynamic(content) for x, content in zip(currency_list, contents)}
+
+    def get_rates(self, dates_list, currency_list):
+        """ Метод получения курсов валют на первое число каждого месяца
+
+        Args:
+            dates_list (list): Месяцы в формате 'MM/YYYY'
+            currency_list (list): Коды валют
+
+        Returns:
+            DataFrame: Фрейм с месяцем в формате 'YYYY-MM' и курсами валют, '' если курса нет
+        """
+        dates = [datetime.strptime(date, '%m/%Y') for date in dates_list]
+        history = {}
+        if len(dates) > 0:
+            # Курс на первое число мог быть установлен до праздников, поэтому период начинается на месяц раньше
+            history = asyncio.run(self.fetch_history(currency_list, min(dates) - relativedelta(months=1), max(dates)))
+        columns = []
+        for currency in currency_list:
+            records = history.get(currency, [])
+            record_dates = [record[0] for record in records]
+            positions = [bisect_right(record_dates, date.date()) for date in dates]
+            columns.append([records[x - 1][1] if x > 0 else '' for x in positions])
+        return pd.DataFrame([[date.strftime('%Y-%m')] + [column[x] for column in columns]
+                             for x, date in enumerate(dates)], columns=['date'] + currency_list)
@@ -0,0 +1,205 @@
+import os
+import tempfile
+import threading
+import time
+from datetime import date, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import TestCase
+from urllib.parse import parse_qs, urlparse
+
+import requests
+
+from CbrRates import AsyncRateFetcher, RangeRateFetcher
+from RateStore import RateStore
+
+
+# Ответ XML_daily.asp на дату вида 01/MM/YYYY: курсы зависят от месяца, KZT указан за 100 единиц, в марте его нет
+def get_valutes(month, year):
+    valutes = [('USD', 1, f'{int(year) - 1970},{month}00'), ('KZT', 100, f'{month},5')]
+    return valutes[:1] if month == '03' else valutes
+
+
+def get_daily(date_req):
+    day, month, year = date_req.split('/')
+    valutes = get_valutes(month, year)
+    body = ''.join(f'<Valute ID="R0"><NumCode>0</NumCode><CharCode>{code}</CharCode><Nominal>{nominal}</Nominal>'
+                   f'<Name>Валюта</Name><Value>{value}</Value></Valute>' for code, nominal, value in valutes)
+    return f'<?xml version="1.0" encoding="windows-1251"?><ValCurs Date="{date_req}" name="Foreign Currency Market">' \
+           f'{body}</ValCurs>'.encode('windows-1251')
+
+
+def get_codes():
+    return '<?xml version="1.0" encoding="windows-1251"?><Valuta name="Foreign Currency Market Lib">' \
+           '<Item ID="R01235"><Name>Доллар США</Name><Nominal>1</Nominal><ISO_Char_Code>USD</ISO_Char_Code></Item>' \
+           '<Item ID="R01335"><Name>Казахстанский тенге</Name><Nominal>100</Nominal>' \
+           '<ISO_Char_Code>KZT</ISO_Char_Code></Item></Valuta>'.encode('windows-1251')
+
+
+# Ответ XML_dynamic.asp с теми же курсами, что и get_daily: январский курс устанавливается 30 декабря,
+# остальные - первого числа, с 15 числа каждого месяца действует другой курс
+def get_dynamic(date_req1, date_req2, currency_id):
+    start_date = datetime.strptime(date_req1, '%d/%m/%Y').date()
+    end_date = datetime.strptime(date_req2, '%d/%m/%Y').date()
+    records = []
+    for year in range(start_date.year, end_date.year + 2):
+        for month in range(1, 13):
+            valute = {x[0]: x for x in get_valutes(f'{month:02}', str(year))}.get(
+                {'R01235': 'USD', 'R01335': 'KZT'}[currency_id])
+            if valute is not None:
+                records.append((date(year - 1, 12, 30) if month == 1 else date(year, month, 1), valute))
+            records.append((date(year, month, 15), (None, 1, '99,0')))
+    body = ''.join(f'<Record Date="{day:%d.%m.%Y}" Id="{currency_id}"><Nominal>{nominal}</Nominal>'
+                   f'<Value>{value}</Value></Record>' for day, (code, nominal, value) in sorted(records)
+                   if start_date <= day <= end_date)
+    return f'<?xml version="1.0" encoding="windows-1251"?><ValCurs ID="{currency_id}" DateRange1="{date_req1}" ' \
+           f'DateRange2="{date_req2}" name="Foreign Currency Market Dynamic">{body}</ValCurs>'.encode('windows-1251')
+
+
+class CbrHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        server = self.server
+        url = urlparse(self.path)
+        query = {key: value[0] for key, value in parse_qs(url.query).items()}
+        if url.path.endswith('XML_valFull.asp'):
+            date_req = 'codes'
+        elif url.path.endswith('XML_dynamic.asp'):
+            date_req = query['VAL_NM_RQ']
+        else:
+            date_req = query['date_req']
+        with server.lock:
+            server.requests.append(date_req)
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+            failures = server.failures.get(date_req, 0)
+            if failures:
+                server.failures[date_req] = failures - 1
+        time.sleep(0.02)
+        if failures:
+            body = b'busy'
+        elif date_req == 'codes':
+            body = get_codes()
+        elif url.path.endswith('XML_dynamic.asp'):
+            body = get_dynamic(query['date_req1'], query['date_req2'], date_req)
+        else:
+            body = get_daily(date_req)
+        self.send_response(503 if failures else 200)
+        self.send_header('Content-Type', 'application/xml; charset=windows-1251')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        with server.lock:
+            server.active -= 1
+
+    def log_message(self, format, *args):
+        pass
+
+
+class CbrServerTestCase(TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), CbrHandler)
+        self.server.lock = threading.Lock()
+        self.server.requests = []
+        self.server.failures = {}
+        self.server.active = 0
+        self.server.max_active = 0
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.start()
+        self.url = f'http://127.0.0.1:{self.server.server_address[1]}/scripts/XML_daily.asp'
+        self.dynamic_url = f'http://127.0.0.1:{self.server.server_address[1]}/scripts/XML_dynamic.asp'
+        self.codes_url = f'http://127.0.0.1:{self.server.server_address[1]}/scripts/XML_valFull.asp'
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+
+
+class AsyncRateFetcherTests(CbrServerTestCase):
+    def test_ordered_rates(self):
+        self.server.failures['01/05/2020'] = 2
+        dates = [f'{month:02}/{year}' for year in (2019, 2020) for month in range(1, 13)]
+        fetcher = AsyncRateFetcher(self.url, concurrency=3, backoff=0.01)
+        rates = fetcher.get_rates(dates, ['KZT', 'USD'])
+        self.assertEqual(list(rates.columns), ['date', 'KZT', 'USD'])
+        self.assertEqual(list(rates['date']), [f'{year}-{month:02}' for year in (2019, 2020) for month in range(1, 13)])
+        self.assertEqual(rates.iloc[4].tolist(), ['2019-05', 0.055, 49.05])
+        self.assertEqual(rates.iloc[2].tolist(), ['2019-03', '', 49.03])
+        self.assertEqual(self.server.requests.count('01/05/2020'), 3)
+        self.assertLessEqual(self.server.max_active, 3)
+        self.assertGreater(self.server.max_active, 1)
+
+    def test_unsorted_currencies(self):
+        rates = AsyncRateFetcher(self.url).get_rates(['05/2019'], ['USD', 'KZT'])
+        self.assertEqual(rates.values.tolist(), [['2019-05', 49.05, 0.055]])
+        ranged = RangeRateFetcher(self.dynamic_url, self.codes_url).get_rates(['05/2019'], ['USD', 'KZT'])
+        self.assertEqual(ranged.values.tolist(), rates.values.tolist())
+
+    def test_retries_exhausted(self):
+        self.server.failures['01/01/2020'] = 5
+        fetcher = AsyncRateFetcher(self.url, retries=2, backoff=0.01)
+        with self.assertRaises(requests.HTTPError):
+            fetcher.get_rates(['01/2020'], ['USD'])
+        self.assertEqual(len(self.server.requests), 3)
+
+
+class RangeRateFetcherTests(CbrServerTestCase):
+    def test_same_as_daily(self):
+        dates = [f'{month:02}/{year}' for year in (2019, 2020) for month in range(1, 13)]
+        fetcher = RangeRateFetcher(self.dynamic_url, self.codes_url, backoff=0.01)
+        rates = fetcher.get_rates(dates, ['KZT', 'USD'])
+        self.assertEqual(sorted(self.server.requests), ['R01235', 'R01335', 'codes'])
+        self.server.requests.clear()
+        daily = AsyncRateFetcher(self.url).get_rates(dates, ['KZT', 'USD'])
+        self.assertEqual(rates['USD'].tolist(), daily['USD'].tolist())
+        self.assertEqual(rates['date'].tolist(), daily['date'].tolist())
+        self.assertEqual(rates[~rates['date'].str.endswith('-03')].values.tolist(),
+                         daily[~daily['date'].str.endswith('-03')].values.tolist())
+        self.assertEqual(rates.iloc[2].tolist(), ['2019-03', 99.0, 49.03])
+
+    def test_unknown_currency(self):
+        fetcher = RangeRateFetcher(self.dynamic_url, self.codes_url, backoff=0.01)
+        rates = fetcher.get_rates(['02/2019', '01/2019'], ['EUR', 'USD'])
+        self.assertEqual(rates.values.tolist(), [['2019-02', '', 49.02], ['2019-01', '', 49.01]])
+        self.assertEqual(sorted(self.server.requests), ['R01235', 'codes'])
+
+
+class RateStoreTests(CbrServerTestCase):
+    def setUp(self):
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'rates.sqlite')
+        self.fetcher = AsyncRateFetcher(self.url, backoff=0.01)
+
+    def tearDown(self):
+        super().tearDown()
+        self.directory.cleanup()
+
+    def test_incremental_update(self):
+        dates = [f'{month:02}/2019' for month in range(1, 13)]
+        with RateStore(self.path) as store:
+            store.update(self.fetcher, dates, ['KZT', 'USD'])
+        self.assertEqual(len(self.server.requests), 12)
+        with RateStore(self.path) as store:
+            self.assertIsNone(store.update(self.fetcher, dates, ['USD', 'KZT']))
+            self.assertEqual(len(self.server.requests), 12)
+            store.update(self.fetcher, dates + ['01/2020'], ['KZT', 'USD'])
+            self.assertEqual(self.server.requests[12:], ['01/01/2020'])
+            self.assertEqual(store.get_rate('2019-05', 'USD'), 49.05)
+            self.assertIsNone(store.get_rate('2019-03', 'KZT'))
+            rates = store.get_rates(['03/2019', '01/2020'], ['USD', 'KZT'])
+        self.assertEqual(rates.values.tolist(), [['2019-03', 49.03, ''], ['2020-01', 50.01, 0.015]])
+
+    def test_new_currency(self):
+        with RateStore(self.path) as store:
+            store.update(self.fetcher, ['01/2019', '02/2019'], ['USD'])
+            store.update(self.fetcher, ['01/2019', '02/2019'], ['KZT', 'USD'])
+            self.assertEqual(len(self.server.requests), 4)
+            self.assertEqual(store.get_rates(['02/2019'], ['KZT', 'USD']).values.tolist(), [['2019-02', 0.025, 49.02]])
+
+    def test_future_month_not_stored(self):
+        with RateStore(self.path) as store:
+            fetched = store.update(self.fetcher, ['01/2999'], ['USD'])
+            self.assertEqual(store.get_rates(['01/2999'], ['USD'], fetched).values.tolist(), [['2999-01', 1029.01]])
+            self.assertEqual(store.get_missing_dates(['01/2999'], ['USD']), ['01/2999'])
@@ -7,6 +7,8 @@ import pandas as pd
 import os
 import cProfile
 
+from DateParser import parse_years
+
 
 def multiprocessing_file(csv_file, profession):
     """ Метод для мультипроцессорности
@@ -17,7 +19,7 @@ def multiprocessing_file(csv_file, profession):
     """
     data_frame = pd.read_csv(csv_file)
     data_frame['salary'] = data_frame[['salary_from', 'salary_to']].mean(axis=1)
-    data_frame['published_at'] = data_frame['published_at'].apply(lambda current: int(current[:4]))
+    data_frame['published_at'] = parse_years(data_frame['published_at'])
     data_frame_vacancy = data_frame[data_frame['name'].str.contains(profession)]
     years_data = data_frame['published_at'].unique()
     dynamics_salary_by_year = {year: [] for year in years_data}
@@ -40,7 +42,7 @@ def single_processing_file(file):
         list: Возвращает динамики по городам
     """
     data_frame = pd.read_csv(file)
-    data_frame['published_at'] = data_frame['published_at'].apply(lambda x: int(x[:4]))
+    data_frame['published_at'] = parse_years(data_frame['published_at'])
     data_frame['salary'] = data_frame[['salary_from', 'salary_to']].mean(axis=1)
     data_frame['count'] = data_frame.groupby('area_name')['area_name'].transform('count')
     data_frame_normal = data_frame[data_frame['count'] > 0.01 * len(data_frame)]
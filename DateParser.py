@@ -0,0 +1,101 @@
+from datetime import datetime, timedelta, timezone
+
+date_format = "%Y-%m-%dT%H:%M:%S%z"
+
+timezone_cache = {}
+
+
+def get_timezone(offset):
+    """Возвращает часовой пояс по смещению вида '+0300', создавая его один раз
+
+    Args:
+        offset (str): Смещение от UTC
+
+    Returns:
+        timezone: Часовой пояс
+
+    >>> get_timezone('+0300') is get_timezone('+0300')
+    True
+    >>> get_timezone('-0130')
+    datetime.timezone(datetime.timedelta(days=-1, seconds=81000))
+    """
+    tz = timezone_cache.get(offset)
+    if tz is None:
+        minutes = int(offset[1:3]) * 60 + int(offset[3:5])
+        tz = timezone_cache[offset] = timezone(timedelta(minutes=-minutes if offset[0] == '-' else minutes))
+    return tz
+
+
+def is_fixed_layout(value):
+    """Проверяет, что дата записана в формате 'YYYY-MM-DDTHH:MM:SS+HHMM'
+
+    Args:
+        value (str): Дата публикации
+
+    Returns:
+        bool: Подходит ли дата для быстрого разбора срезами
+    """
+    return len(value) == 24 and value[4] == '-' and value[7] == '-' and value[10] == 'T' \
+        and value[13] == ':' and value[16] == ':' and value[19] in '+-'
+
+
+def parse_datetime(value):
+    """Разбирает дату публикации вакансии.
+    Для формата hh.ru дата собирается из срезов строки, иначе используется strptime
+
+    Args:
+        value (str): Дата публикации
+
+    Returns:
+        datetime: Дата публикации с часовым поясом
+
+    >>> parse_datetime('2012-04-09T13:49:00+0400') == datetime.strptime('2012-04-09T13:49:00+0400', date_format)
+    True
+    >>> parse_datetime('2012-04-09T13:49:00+04:00').utcoffset()
+    datetime.timedelta(seconds=14400)
+    """
+    if not is_fixed_layout(value):
+        return datetime.strptime(value, date_format)
+    return datetime(int(value[:4]), int(value[5:7]), int(value[8:10]), int(value[11:13]), int(value[14:16]),
+                     int(value[17:19]), tzinfo=get_timezone(value[19:]))
+
+
+def parse_year(value):
+    """Возвращает год публикации вакансии
+
+    Args:
+        value (str): Дата публикации
+
+    Returns:
+        int: Год публикации
+
+    >>> parse_year('2012-04-09T13:49:00+0400')
+    2012
+    """
+    if not is_fixed_layout(value):
+        return datetime.strptime(value, date_format).year
+    return int(value[:4])
+
+
+def parse_years(column):
+    """Векторный вариант parse_year для столбца pandas
+
+    Args:
+        column (Series): Столбец дат публикации
+
+    Returns:
+        Series: Столбец годов публикации
+    """
+    return column.str.slice(0, 4).astype(int)
+
+
+def parse_months(column):
+    """Возвращает месяц публикации в формате 'YYYY-MM' для столбца pandas
+
+    Args:
+        column (Series): Столбец дат публикации
+
+    Returns:
+        Series: Столбец месяцев публикации
+    """
+    return column.str.slice(0, 7)
@@ -0,0 +1,128 @@
+import hashlib
+import json
+import os
+import re
+
+# То же, что '<.*?>': тег до первой '>', без перевода строки внутри, но без возвратов при поиске
+tag_pattern = re.compile('<[^>\n]*>')
+
+
+class HtmlCleaner:
+    """Очистка полей вакансий от html с кэшем очищенного текста по хэшу содержимого.
+    Кэш сохраняется в JSON рядом с исходным файлом, поэтому повторные запуски по той же выгрузке
+    не очищают уже встречавшиеся описания заново. Если папка недоступна для записи, кэш не сохраняется
+
+    Attributes:
+        cache (dict): Словарь hex-хэш исходного текста:очищенный текст
+        min_length (int): Минимальная длина текста, который кладётся в кэш
+        changed (bool): Появились ли в кэше записи, которых нет в файле
+    """
+    def __init__(self, min_length=256):
+        """Инициализирует объекты HtmlCleaner
+
+        Args:
+            min_length (int): Минимальная длина текста, который кладётся в кэш
+        """
+        self.cache = {}
+        self.min_length = min_length
+        self.changed = False
+
+    @staticmethod
+    def strip_tags(value):
+        """Удаляет html-теги за один проход по строке.
+        Как и регулярное выражение '<.*?>', тег не может содержать перевод строки
+
+        Args:
+            value (str): Исходный текст
+
+        Returns:
+            str: Текст без тегов
+
+        >>> HtmlCleaner.strip_tags('<p><strong>Python</strong> и Git</p>')
+        'Python и Git'
+        >>> HtmlCleaner.strip_tags('a <b\\nc> d<i>')
+        'a <b\\nc> d'
+        """
+        return tag_pattern.sub('', value)
+
+    @staticmethod
+    def clean_text(value):
+        """Удаляет теги и лишние пробелы, разбивает текст на строки
+
+        Args:
+            value (str): Исходный текст
+
+        Returns:
+            str or list: Очищенный текст или список строк, если строк несколько
+
+        >>> HtmlCleaner.clean_text('<p>Опыт  работы</p>\\r\\n<p> Git </p>')
+        ['Опыт работы', 'Git']
+        """
+        result = [" ".join(line.split()) for line in HtmlCleaner.strip_tags(value).replace("\r\n", "\n").split('\n')]
+        if len(result) == 1:
+            return result[0]
+        return result
+
+    def clean(self, value):
+        """Очищает текст, беря результат из кэша, если такой текст уже встречался
+
+        Args:
+            value (str): Исходный текст
+
+        Returns:
+            str or list: Очищенный текст или список строк, если строк несколько
+        """
+        if len(value) < self.min_length:
+            return self.clean_text(value)
+        key = hashlib.blake2b(value.encode(), digest_size=16).hexdigest()
+        result = self.cache.get(key)
+        if result is None:
+            result = self.cache[key] = self.clean_text(value)
+            self.changed = True
+        return result
+
+    @staticmethod
+    def get_sidecar(file_name):
+        """Возвращает путь к файлу кэша для исходного файла
+
+        Args:
+            file_name (str): Название исходного файла
+
+        Returns:
+            str: Путь к файлу кэша
+        """
+        return f'{file_name}.clean.json'
+
+    def load(self, file_name):
+        """Загружает кэш, сохранённый для исходного файла
+
+        Args:
+            file_name (str): Название исходного файла
+        """
+        try:
+            with open(self.get_sidecar(file_name), encoding='utf_8') as file:
+                cache = json.load(file)
+        except (OSError, ValueError):
+            return
+        if type(cache) == dict:
+            self.cache.update((key, value) for key, value in cache.items() if type(value) in (str, list))
+
+    def save(self, file_name):
+        """Сохраняет кэш рядом с исходным файлом, если в нём появились новые записи.
+        Ошибки записи пропускаются: кэш только ускоряет следующие запуски
+
+        Args:
+            file_name (str): Название исходного файла
+        """
+        if not self.changed:
+            return
+        path = self.get_sidecar(file_name)
+        try:
+            with open(f'{path}.tmp', 'w', encoding='utf_8') as file:
+                json.dump(self.cache, file, ensure_ascii=False)
+            os.replace(f'{path}.tmp', path)
+        except OSError:
+            if os.path.exists(f'{path}.tmp'):
+                os.remove(f'{path}.tmp')
+            return
+        self.changed = False
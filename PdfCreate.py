@@ -1,22 +1,21 @@
+import copy
 import csv
-from datetime import datetime
-from statistics import mean
 import doctest
+import io
+import os
+from concurrent import futures
+from time import perf_counter
 
-import matplotlib.pyplot as plt
-import numpy as np
-import openpyxl
-import openpyxl.styles.numbers
-import pdfkit
-from jinja2 import Environment, FileSystemLoader
-from openpyxl.styles import NamedStyle, Border, Side, Font
+from AggregateCache import AggregateCache
+from DateParser import parse_year
+from ProfessionMatcher import ProfessionMatcher
 
 
 class SalaryDict:
     """Класс для хранения и предоставления словаря по зарплате
 
     Attributes:
-        salary_dictionary (dict): Словарь зарплат
+        salary_dictionary (dict): Словарь ключ:[сумма зарплат, количество зарплат]
         __average_salary_dictionary (dict): Словарь средних зарплат
     """
     def __init__(self):
@@ -27,19 +26,18 @@ class SalaryDict:
         self.__average_salary_dictionary = {}
 
     def add(self, key, salary):
-        """Добавление в словарь по ключу и зарплате
+        """Добавление в словарь по ключу и зарплате.
+        Хранится только текущая сумма и количество зарплат, поэтому память не растёт с числом вакансий
 
         Args:
             key (str): Ключ
             salary (int): Зарплата
-
-        Returns:
-            dict: Возвращает словарь с добавленным значением
         """
-
-        if self.salary_dictionary.get(key) is None:
-            self.salary_dictionary[key] = []
-        return self.salary_dictionary[key].append(salary)
+        item = self.salary_dictionary.get(key)
+        if item is None:
+            item = self.salary_dictionary[key] = [0, 0]
+        item[0] += salary
+        item[1] += 1
 
     def average_salary(self):
         """Метод для формирования словаря средней заработной платы
@@ -47,10 +45,24 @@ class SalaryDict:
         Returns:
             dict: Словарь средней заработной платы
         """
-        for key, value in self.salary_dictionary.items():
-            self.__average_salary_dictionary[key] = int(mean(value))
+        for key, (salary_sum, salary_count) in self.salary_dictionary.items():
+            self.__average_salary_dictionary[key] = salary_sum // salary_count
         return self.__average_salary_dictionary
 
+    def merge(self, other):
+        """Добавляет суммы и количества зарплат из другого словаря.
+        Новые ключи добавляются в конец, поэтому порядок ключей совпадает с последовательным чтением
+
+        Args:
+            other (SalaryDict): Словарь, полученный по следующей части файла
+        """
+        for key, (salary_sum, salary_count) in other.salary_dictionary.items():
+            item = self.salary_dictionary.get(key)
+            if item is None:
+                item = self.salary_dictionary[key] = [0, 0]
+            item[0] += salary_sum
+            item[1] += salary_count
+
     def top_salary(self, top_cities):
         """Метод для формирования словаря самых высокооплачеваемых зарплат
 
@@ -98,6 +110,16 @@ class CountDict:
         self.count_dict[key] += 1
         self.length += 1
 
+    def merge(self, other):
+        """Добавляет количества из другого словаря
+
+        Args:
+            other (CountDict): Словарь, полученный по следующей части файла
+        """
+        for key, value in other.count_dict.items():
+            self.count_dict[key] = self.count_dict.get(key, 0) + value
+        self.length += other.length
+
     def percentage(self):
         """Делает выборку по вакансиям от процента длины словаря
         """
@@ -128,18 +150,18 @@ class Vacancy:
         Args:
             fields (dict): Словарь вакансии
 
-        >>>vacancy = [Vacancy({'name': 'Программист','salary_from': '40000.0',
-        ...'salary_to': '55000.0', 'salary_currency': 'RUR', 'area_name': 'Москва',
-        ...'published_at': '2012-04-09T13:49:00+0400'})]
-        >>>type(Vacancy(vacancy)).__name__
+        >>> vacancy = {'name': 'Программист', 'salary_from': '40000.0',
+        ...     'salary_to': '55000.0', 'salary_currency': 'RUR', 'area_name': 'Москва',
+        ...     'published_at': '2012-04-09T13:49:00+0400'}
+        >>> type(Vacancy(vacancy)).__name__
         'Vacancy'
-        >>>Vacancy(vacancy).job_name
+        >>> Vacancy(vacancy).job_name
         'Программист'
-        >>>Vacancy(vacancy).salary
+        >>> Vacancy(vacancy).salary
         47500
-        >>>Vacancy(vacancy).area_name
+        >>> Vacancy(vacancy).area_name
         'Москва'
-        >>>Vacancy(vacancy).year
+        >>> Vacancy(vacancy).year
         2012
         """
         self.__dictionary_currency_to_rub = {
@@ -159,7 +181,7 @@ class Vacancy:
             (float(fields['salary_from']) + float(fields['salary_to'])) / 2 * self.__dictionary_currency_to_rub[
                 fields['salary_currency']])
         self.area_name = fields['area_name']
-        self.year = int(datetime.strptime(fields['published_at'], "%Y-%m-%dT%H:%M:%S%z").strftime("%Y"))
+        self.year = parse_year(fields['published_at'])
 
 
 class Total:
@@ -178,23 +200,23 @@ class Total:
     def __init__(self):
         """Инициализирует объекты Total
 
-        >>>test_param = Total()
-        >>>vacancy = [Vacancy({'name': 'Программист','salary_from': '40000.0',
-        ...'salary_to': '55000.0', 'salary_currency': 'RUR', 'area_name': 'Москва',
-        ...'published_at': '2012-04-09T13:49:00+0400'})]
-        >>>test_param.get_data(vacancy, 'Специалист')
-        >>>test_param.dynamics_count_by_year.count_dict
+        >>> test_param = Total()
+        >>> vacancy = [Vacancy({'name': 'Программист', 'salary_from': '40000.0',
+        ...     'salary_to': '55000.0', 'salary_currency': 'RUR', 'area_name': 'Москва',
+        ...     'published_at': '2012-04-09T13:49:00+0400'})]
+        >>> test_param = test_param.get_data(vacancy, 'Специалист')
+        >>> test_param.dynamics_count_by_year.count_dict
         {2012: 1}
-        >>>test_param.dynamics_job_count_city.count_dict
+        >>> test_param.dynamics_job_count_city.count_dict
         {'Москва': 1}
-        >>>test_param.dynamics_job_count_year.count_dict
+        >>> test_param.dynamics_job_count_year.count_dict
         {2012: 0}
-        >>>test_param.dynamics_job_salary_city.salary_dictionary
-        {'Москва': [47500]}
-        >>>test_param.dynamics_job_salary_year.salary_dictionary
-        {2012: [0]}
-        >>>test_param.dynamics_salary_by_year.salary_dictionary
-        {2012: [47500]}
+        >>> test_param.dynamics_job_salary_city.salary_dictionary
+        {'Москва': [47500, 1]}
+        >>> test_param.dynamics_job_salary_year.salary_dictionary
+        {2012: [0, 1]}
+        >>> test_param.dynamics_salary_by_year.salary_dictionary
+        {2012: [47500, 1]}
         """
         self.dynamics_salary_by_year = SalaryDict()
         self.dynamics_count_by_year = CountDict()
@@ -207,12 +229,22 @@ class Total:
         """Анализ данных по вакансиям
 
         Args:
-           vacancies (list): Своварь вакансий
+           vacancies (iterable): Вакансии (список или генератор объектов Vacancy)
            job_name (str): Название вводимой профессии
 
         Returns:
             self: Возвращает объект класса Total
         """
+        self.add_data(vacancies, job_name)
+        return self.finish_data()
+
+    def add_data(self, vacancies, job_name):
+        """Добавляет вакансии в словари без завершения анализа
+
+        Args:
+           vacancies (iterable): Вакансии (список или генератор объектов Vacancy)
+           job_name (str): Название вводимой профессии
+        """
         self.job_name = job_name
         for vacancy in vacancies:
             self.dynamics_salary_by_year.add(vacancy.year, vacancy.salary)
@@ -222,13 +254,85 @@ class Total:
             if job_name in vacancy.job_name:
                 self.dynamics_job_salary_year.add(vacancy.year, vacancy.salary)
                 self.dynamics_job_count_year.add(vacancy.year)
+
+    def merge(self, other):
+        """Объединяет частичный результат анализа другой части файла с текущим
+
+        Args:
+            other (Total): Результат анализа следующей части файла
+
+        Returns:
+            self: Возвращает объект класса Total
+        """
+        self.job_name = other.job_name
+        self.dynamics_salary_by_year.merge(other.dynamics_salary_by_year)
+        self.dynamics_count_by_year.merge(other.dynamics_count_by_year)
+        self.dynamics_job_salary_year.merge(other.dynamics_job_salary_year)
+        self.dynamics_job_count_year.merge(other.dynamics_job_count_year)
+        self.dynamics_job_salary_city.merge(other.dynamics_job_salary_city)
+        self.dynamics_job_count_city.merge(other.dynamics_job_count_city)
+        return self
+
+    def finish_data(self):
+        """Завершает анализ: заполняет пустые словари по профессии и считает доли вакансий по городам
+
+        Returns:
+            self: Возвращает объект класса Total
+        """
+        self.fill_empty_job_data()
+        self.dynamics_job_count_city.percentage()
+        return self
+
+    def fill_empty_job_data(self):
+        """Если вакансий по профессии не найдено, заполняет её словари нулями по всем годам
+
+        """
         if self.dynamics_job_salary_year.salary_dictionary == {}:
-            self.dynamics_job_salary_year.salary_dictionary = {i: [0] for i in
+            self.dynamics_job_salary_year.salary_dictionary = {i: [0, 1] for i in
                                                                self.dynamics_salary_by_year.salary_dictionary.keys()}
         if self.dynamics_job_count_year.count_dict == {}:
             self.dynamics_job_count_year.count_dict = {i: 0 for i in self.dynamics_count_by_year.count_dict.keys()}
-        self.dynamics_job_count_city.percentage()
-        return self
+
+    @staticmethod
+    def get_batch_data(vacancies, job_names):
+        """Анализ данных сразу для нескольких профессий за один проход по вакансиям.
+        Профессии ищутся в названии вакансии автоматом Ахо-Корасик, поэтому стоимость строки
+        не растёт линейно с количеством профессий
+
+        Args:
+           vacancies (iterable): Вакансии (список или генератор объектов Vacancy)
+           job_names (list[str]): Названия профессий
+
+        Returns:
+            dict: Словарь профессия:Total. Словари, не зависящие от профессии, общие для всех Total
+
+        >>> vacancies = [Vacancy({'name': name, 'salary_from': '100.0', 'salary_to': '300.0',
+        ...     'salary_currency': 'RUR', 'area_name': 'Москва', 'published_at': '2012-04-09T13:49:00+0400'})
+        ...     for name in ['Программист', 'Аналитик', 'Программист-аналитик']]
+        >>> totals = Total.get_batch_data(vacancies, ['Программист', 'аналитик', 'Повар'])
+        >>> {job_name: total.dynamics_job_count_year.count_dict for job_name, total in totals.items()}
+        {'Программист': {2012: 2}, 'аналитик': {2012: 1}, 'Повар': {2012: 0}}
+        """
+        matcher = ProfessionMatcher(job_names)
+        common = Total()
+        totals = {job_name: Total() for job_name in job_names}
+        for vacancy in vacancies:
+            common.dynamics_salary_by_year.add(vacancy.year, vacancy.salary)
+            common.dynamics_count_by_year.add(vacancy.year)
+            common.dynamics_job_salary_city.add(vacancy.area_name, vacancy.salary)
+            common.dynamics_job_count_city.add(vacancy.area_name)
+            for job_name in matcher.find(vacancy.job_name):
+                totals[job_name].dynamics_job_salary_year.add(vacancy.year, vacancy.salary)
+                totals[job_name].dynamics_job_count_year.add(vacancy.year)
+        common.dynamics_job_count_city.percentage()
+        for job_name, total in totals.items():
+            total.job_name = job_name
+            total.dynamics_salary_by_year = common.dynamics_salary_by_year
+            total.dynamics_count_by_year = common.dynamics_count_by_year
+            total.dynamics_job_salary_city = common.dynamics_job_salary_city
+            total.dynamics_job_count_city = common.dynamics_job_count_city
+            total.fill_empty_job_data()
+        return totals
 
     def print_result(self):
         """Печатает результат анализа данных
@@ -255,6 +359,226 @@ class Total:
         Report(self.job_name, dynamics_salary_by_year, dynamics_count_by_year, dynamics_job_salary_year,
                dynamics_job_count_year, dynamics_job_salary_city, dynamics_job_count_city).generate_pdf()
 
+    def generate_full_excel(self, file_name='report_full.xlsx'):
+        """Выгружает в эксель полную статистику по всем годам и всем городам, а не только топ-10.
+        Строки формируются генераторами и пишутся потоково, поэтому память не зависит от числа городов
+
+        Args:
+            file_name (str): Название эксель-файла
+        """
+        salary_by_year = self.dynamics_salary_by_year.average_salary()
+        count_by_year = self.dynamics_count_by_year.count_dict
+        job_salary_year = self.dynamics_job_salary_year.average_salary()
+        job_count_year = self.dynamics_job_count_year.count_dict
+        salary_city = self.dynamics_job_salary_city.average_salary()
+        count_city = self.dynamics_job_count_city.count_dict
+        length = self.dynamics_job_count_city.length
+        write_excel_stream(file_name, [
+            ('Статистика по годам',
+             ['Год', 'Средняя зарплата', f'Средняя зарплата - {self.job_name}',
+              'Количество вакансий', f'Количество вакансий - {self.job_name}'],
+             lambda: ([year, value, job_salary_year.get(year, 0), count_by_year[year], job_count_year.get(year, 0)]
+                      for year, value in salary_by_year.items()),
+             {}),
+            ('Статистика по городам',
+             ['Город', 'Уровень зарплат', 'Количество вакансий', 'Доля вакансий'],
+             lambda: ([city, salary_city[city], count, count / length]
+                      for city, count in sorted(count_city.items(), key=lambda x: x[1], reverse=True)),
+             {3: '0.00%'}),
+        ])
+
+
+class NumpyTotal(Total):
+    """Векторизованный вариант Total.
+    Год, город и название переводятся в целочисленные коды, суммы и количества считаются по целым столбцам
+    через np.add.at и np.bincount. Поиск профессии выполняется один раз для каждого различного названия.
+    Результат совпадает с Total
+    """
+    def add_data(self, vacancies, job_name):
+        """Добавляет вакансии в пустые словари без завершения анализа
+
+        Args:
+           vacancies (iterable): Вакансии (список или генератор объектов Vacancy)
+           job_name (str): Название вводимой профессии
+
+        >>> vacancies = [Vacancy({'name': name, 'salary_from': '100.0', 'salary_to': salary,
+        ...     'salary_currency': 'RUR', 'area_name': area, 'published_at': date})
+        ...     for name, salary, area, date in [('Программист', '300.0', 'Москва', '2012-04-09T13:49:00+0400'),
+        ...                                      ('Аналитик', '100.0', 'Тула', '2011-04-09T13:49:00+0400'),
+        ...                                      ('Программист', '500.0', 'Тула', '2012-04-09T13:49:00+0400')]]
+        >>> test_param = NumpyTotal().get_data(vacancies, 'Программист')
+        >>> test_param.dynamics_salary_by_year.salary_dictionary
+        {2012: [500, 2], 2011: [100, 1]}
+        >>> test_param.dynamics_job_count_year.count_dict
+        {2012: 2}
+        >>> test_param.dynamics_job_salary_city.average_salary()
+        {'Москва': 200, 'Тула': 200}
+        """
+        import numpy as np
+
+        self.job_name = job_name
+        year_codes, area_codes, name_codes, salaries = [], [], [], []
+        years, areas, names = {}, {}, {}
+        for vacancy in vacancies:
+            year_codes.append(years.setdefault(vacancy.year, len(years)))
+            area_codes.append(areas.setdefault(vacancy.area_name, len(areas)))
+            name_codes.append(names.setdefault(vacancy.job_name, len(names)))
+            salaries.append(vacancy.salary)
+        year_codes = np.array(year_codes, dtype=np.intp)
+        area_codes = np.array(area_codes, dtype=np.intp)
+        name_codes = np.array(name_codes, dtype=np.intp)
+        salaries = np.array(salaries, dtype=np.int64)
+        unique_mask = np.array([job_name in name for name in names], dtype=bool)
+        job_mask = unique_mask[name_codes]
+        years, areas = list(years), list(areas)
+
+        self.fill_dicts(self.dynamics_salary_by_year, self.dynamics_count_by_year, years, year_codes, salaries)
+        self.fill_dicts(self.dynamics_job_salary_city, self.dynamics_job_count_city, areas, area_codes, salaries)
+        self.fill_dicts(self.dynamics_job_salary_year, self.dynamics_job_count_year, years, year_codes[job_mask],
+                        salaries[job_mask])
+
+    @staticmethod
+    def fill_dicts(salary_dict, count_dict, keys, codes, salaries):
+        """Заполняет SalaryDict и CountDict суммами и количествами по кодам ключей.
+        Ключи идут в порядке первого появления, как в Total
+
+        Args:
+            salary_dict (SalaryDict): Заполняемый словарь зарплат
+            count_dict (CountDict): Заполняемый словарь количества
+            keys (list): Ключи, индекс ключа равен его коду
+            codes (np.ndarray): Коды ключей по вакансиям
+            salaries (np.ndarray): Зарплаты по вакансиям
+        """
+        import numpy as np
+
+        sums = np.zeros(len(keys), dtype=np.int64)
+        np.add.at(sums, codes, salaries)
+        counts = np.bincount(codes, minlength=len(keys))
+        unique_codes, first_index = np.unique(codes, return_index=True)
+        for code in unique_codes[np.argsort(first_index)].tolist():
+            salary_dict.salary_dictionary[keys[code]] = [int(sums[code]), int(counts[code])]
+            count_dict.count_dict[keys[code]] = int(counts[code])
+        count_dict.length += len(codes)
+
+
+class CacheData:
+    """Данные для кэша анализа: словари, не зависящие от профессии, и сжатый столбец названий вакансий.
+    По ним словари для любой профессии строятся без повторного чтения CSV-файла
+
+    Attributes:
+        total (Total): Незавершённый Total без словарей по профессии
+        names (dict): Словарь название:{год: [сумма зарплат, количество, номер первой вакансии]}
+    """
+    salary_names = ['dynamics_salary_by_year', 'dynamics_job_salary_city']
+    count_names = ['dynamics_count_by_year', 'dynamics_job_count_city']
+    def __init__(self):
+        """Инициализирует объекты CacheData
+
+        """
+        self.total = Total()
+        self.names = {}
+
+    def add_data(self, vacancies):
+        """Добавляет вакансии в словари
+
+        Args:
+           vacancies (iterable): Вакансии (список или генератор объектов Vacancy)
+
+        Returns:
+            self: Возвращает объект класса CacheData
+        """
+        total = self.total
+        for index, vacancy in enumerate(vacancies):
+            total.dynamics_salary_by_year.add(vacancy.year, vacancy.salary)
+            total.dynamics_count_by_year.add(vacancy.year)
+            total.dynamics_job_salary_city.add(vacancy.area_name, vacancy.salary)
+            total.dynamics_job_count_city.add(vacancy.area_name)
+            years = self.names.get(vacancy.job_name)
+            if years is None:
+                years = self.names[vacancy.job_name] = {}
+            item = years.get(vacancy.year)
+            if item is None:
+                item = years[vacancy.year] = [0, 0, index]
+            item[0] += vacancy.salary
+            item[1] += 1
+        return self
+
+    def to_json(self):
+        """Переводит данные в вид для JSON. Словари хранятся списками пар,
+        чтобы сохранить порядок ключей и целые годы
+
+        Returns:
+            dict: Данные для JSON
+        """
+        return {'salary': {name: list(getattr(self.total, name).salary_dictionary.items())
+                           for name in self.salary_names},
+                'count': {name: [list(getattr(self.total, name).count_dict.items()), getattr(self.total, name).length]
+                          for name in self.count_names},
+                'names': [[name, list(years.items())] for name, years in self.names.items()]}
+
+    @staticmethod
+    def from_json(data):
+        """Восстанавливает данные из вида для JSON
+
+        Args:
+            data (dict): Данные, полученные из to_json
+
+        Returns:
+            CacheData: Восстановленные данные
+
+        >>> vacancies = [Vacancy({'name': 'Программист', 'salary_from': '100.0', 'salary_to': '300.0',
+        ...     'salary_currency': 'RUR', 'area_name': 'Москва', 'published_at': '2013-04-09T13:49:00+0400'})]
+        >>> CacheData.from_json(CacheData().add_data(vacancies).to_json()).names
+        {'Программист': {2013: [200, 1, 0]}}
+        """
+        cache_data = CacheData()
+        for name in CacheData.salary_names:
+            getattr(cache_data.total, name).salary_dictionary.update(
+                (key, [int(x) for x in item]) for key, item in data['salary'][name])
+        for name in CacheData.count_names:
+            count_dict, length = data['count'][name]
+            getattr(cache_data.total, name).count_dict.update((key, int(count)) for key, count in count_dict)
+            getattr(cache_data.total, name).length = int(length)
+        cache_data.names = {name: {int(year): [int(x) for x in item] for year, item in years}
+                            for name, years in data['names']}
+        return cache_data
+
+    def get_total(self, job_name):
+        """Строит завершённый результат анализа для профессии.
+        Годы добавляются в порядке первой подходящей вакансии, как при чтении файла
+
+        Args:
+            job_name (str): Название вводимой профессии
+
+        Returns:
+            Total: Результат анализа
+
+        >>> vacancies = [Vacancy({'name': name, 'salary_from': '100.0', 'salary_to': '300.0',
+        ...     'salary_currency': 'RUR', 'area_name': 'Москва', 'published_at': date})
+        ...     for name, date in [('Аналитик', '2013-04-09T13:49:00+0400'), ('Программист', '2012-04-09T13:49:00+0400'),
+        ...                        ('Программист-аналитик', '2013-04-09T13:49:00+0400')]]
+        >>> CacheData().add_data(vacancies).get_total('аналитик').dynamics_job_salary_year.salary_dictionary
+        {2013: [200, 1]}
+        >>> CacheData().add_data(vacancies).get_total('Программист').dynamics_job_count_year.count_dict
+        {2012: 1, 2013: 1}
+        """
+        total = copy.deepcopy(self.total)
+        total.job_name = job_name
+        matches = sorted((first_index, year, salary_sum, salary_count)
+                         for name, years in self.names.items() if job_name in name
+                         for year, (salary_sum, salary_count, first_index) in years.items())
+        salary_dictionary = total.dynamics_job_salary_year.salary_dictionary
+        count_dict = total.dynamics_job_count_year
+        for _, year, salary_sum, salary_count in matches:
+            item = salary_dictionary.get(year)
+            if item is None:
+                item = salary_dictionary[year] = [0, 0]
+            item[0] += salary_sum
+            item[1] += salary_count
+            count_dict.count_dict[year] = count_dict.count_dict.get(year, 0) + salary_count
+            count_dict.length += salary_count
+        return total.finish_data()
+
 
 class Report():
     """Класс для представления отчета по анализу вакансий
@@ -294,10 +618,32 @@ class Report():
         self.tab_second = []
         self.tab_third = []
 
+    def generate_tables(self):
+        """Формирует таблицы отчёта по словарям анализа
+
+        """
+        self.tab_first = [['Год', 'Средняя зарплата', f'Средняя зарплата - {self.job_name}',
+                           'Количество вакансий', f'Количество вакансий - {self.job_name}']]
+        for year, value in self.dynamics_salary_by_year.items():
+            self.tab_first.append([year, value, self.dynamics_job_salary_year[year], self.dynamics_count_by_year[year],
+                                   self.dynamics_job_count_year[year]])
+        self.tab_second = [['Город', 'Уровень зарплат']]
+        self.tab_third = [['Город', 'Доля вакансий']]
+        a = iter(self.dynamics_job_count_city)
+        for city, value in self.dynamics_job_salary_city.items():
+            city_count = next(a)
+            self.tab_second.append([city, value])
+            self.tab_third.append([city_count, self.dynamics_job_count_city[city_count]])
+
     def generate_excel(self):
         """Генерирует эксель-файл
 
         """
+        import openpyxl
+        from openpyxl.styles import NamedStyle, Border, Side, Font
+
+        if not self.tab_first:
+            self.generate_tables()
         wb = openpyxl.Workbook()
         wb.active.title = 'Статистика по годам'
         wb.create_sheet('Статистика по городам')
@@ -310,13 +656,7 @@ class Report():
         wb.add_named_style(ns_header)
         wb.add_named_style(ns_border)
         year_sheet = wb['Статистика по годам']
-        headers = ['Год', 'Средняя зарплата', f'Средняя зарплата - {self.job_name}',
-                   'Количество вакансий', f'Количество вакансий - {self.job_name}']
-        self.tab_first.append(headers)
-        year_sheet.append(headers)
-        for year, value in self.dynamics_salary_by_year.items():
-            line = [year, value, self.dynamics_job_salary_year[year], self.dynamics_count_by_year[year], self.dynamics_job_count_year[year]]
-            self.tab_first.append(line)
+        for line in self.tab_first:
             year_sheet.append(line)
         dims = {}
         for row in year_sheet.rows:
@@ -329,18 +669,8 @@ class Report():
             year_sheet.column_dimensions[column].width = value + 2
 
         year_city = wb['Статистика по городам']
-        headers_second = ['Город', 'Уровень зарплат', '', 'Город', 'Доля вакансий']
-        self.tab_second.append(headers_second[:2])
-        self.tab_third.append(headers_second[3:])
-        year_city.append(headers_second)
-        a = iter(self.dynamics_job_count_city)
-        for city, value in self.dynamics_job_salary_city.items():
-            city_count = next(a)
-            line_first = [city, value]
-            line_second = [city_count, self.dynamics_job_count_city[city_count]]
+        for line_first, line_second in zip(self.tab_second, self.tab_third):
             year_city.append([*line_first, '', *line_second])
-            self.tab_second.append(line_first)
-            self.tab_third.append(line_second)
         dims = {}
         for row in year_city.rows:
             for cell in row:
@@ -358,14 +688,19 @@ class Report():
 
         wb.save('report.xlsx')
 
-    def generate_pdf(self):
-        """Метод для генерации pdf файла
+    def generate_html(self):
+        """Метод для заполнения html-шаблона отчёта
 
+        Returns:
+            str: Html-код отчёта
         """
+        from jinja2 import Environment, FileSystemLoader
+
+        if not self.tab_first:
+            self.generate_tables()
         env = Environment(loader=FileSystemLoader('.'))
         template = env.get_template("pdf_template.html")
-        self.generate_excel()
-        pdf_template = template.render({
+        return template.render({
             'image': 'graph.png',
             'first_table': self.tab_first[1:],
             'first_table_header': self.tab_first[0],
@@ -376,13 +711,41 @@ class Report():
             'third_table_header': self.tab_third[0],
             'job_name': self.job_name
         })
+
+    def generate_pdf(self):
+        """Метод для генерации pdf файла.
+        Эксель-файл и графики независимы друг от друга и строятся в отдельных процессах, пока заполняется
+        html-шаблон. Только конвертация в pdf ждёт их завершения. Время этапов выводится в консоль
+
+        Returns:
+            dict: Время выполнения этапов в секундах
+        """
+        import pdfkit
+
+        start = perf_counter()
+        timings = {}
+        self.generate_tables()
+        with futures.ProcessPoolExecutor(2) as executor:
+            excel = executor.submit(run_timed, self.generate_excel)
+            image = executor.submit(run_timed, self.generate_image)
+            pdf_template, timings['Шаблон html'] = run_timed(self.generate_html)
+            timings['Эксель-файл'] = excel.result()[1]
+            timings['Графики'] = image.result()[1]
         config = pdfkit.configuration(wkhtmltopdf=r'C:\Program Files\wkhtmltopdf\bin\wkhtmltopdf.exe')
-        pdfkit.from_string(pdf_template, 'report.pdf', configuration=config, options={"enable-local-file-access": ""})
+        _, timings['Pdf-файл'] = run_timed(pdfkit.from_string, pdf_template, 'report.pdf', configuration=config,
+                                           options={"enable-local-file-access": ""})
+        timings['Всего'] = perf_counter() - start
+        for stage, seconds in timings.items():
+            print(f"{stage}: {seconds:.3f} с")
+        return timings
 
     def generate_image(self):
         """Метод для генерации изображения требуемых графиков
 
         """
+        import matplotlib.pyplot as plt
+        import numpy as np
+
         graph = plt.figure()
         x_nums = np.arange(len(self.dynamics_salary_by_year.keys()))
         width = 0.4
@@ -432,6 +795,68 @@ class Report():
         plt.savefig('graph.png')
 
 
+def write_excel_stream(file_name, sheets):
+    """Потоково записывает таблицы в эксель-файл в режиме write-only.
+    Ширина столбцов считается первым проходом по строкам, затем строки пишутся вторым проходом,
+    поэтому в памяти не хранится ни одна таблица целиком
+
+    Args:
+        file_name (str): Название эксель-файла
+        sheets (list[tuple]): Листы в виде (название, заголовки, функция, возвращающая новый итератор строк,
+            словарь номер столбца:формат числа)
+    """
+    import openpyxl
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Border, Side, Font
+    from openpyxl.utils import get_column_letter
+
+    side = Side(style='thin', color='000000')
+    border = Border(left=side, top=side, right=side, bottom=side)
+    font = Font(bold=True)
+    wb = openpyxl.Workbook(write_only=True)
+    for title, headers, get_rows, number_formats in sheets:
+        sheet = wb.create_sheet(title)
+        dims = [len(str(header)) for header in headers]
+        for row in get_rows():
+            for index, value in enumerate(row):
+                dims[index] = max(dims[index], len(str(value)))
+        for index, value in enumerate(dims):
+            sheet.column_dimensions[get_column_letter(index + 1)].width = value + 2
+        header_row = []
+        for header in headers:
+            cell = WriteOnlyCell(sheet, header)
+            cell.border = border
+            cell.font = font
+            header_row.append(cell)
+        sheet.append(header_row)
+        for row in get_rows():
+            cells = []
+            for index, value in enumerate(row):
+                cell = WriteOnlyCell(sheet, value)
+                cell.border = border
+                if index in number_formats:
+                    cell.number_format = number_formats[index]
+                cells.append(cell)
+            sheet.append(cells)
+    wb.save(file_name)
+
+
+def run_timed(function, *args, **kwargs):
+    """Выполняет функцию и замеряет время её выполнения
+
+    Args:
+        function (callable): Функция
+        *args: Позиционные аргументы функции
+        **kwargs: Именованные аргументы функции
+
+    Returns:
+        tuple: Результат функции и время выполнения в секундах
+    """
+    start = perf_counter()
+    result = function(*args, **kwargs)
+    return result, perf_counter() - start
+
+
 def csv_reader(file_name):
     """Производит чтение файла
 
@@ -442,12 +867,12 @@ def csv_reader(file_name):
         list: Возвращает список словарей с вакансиями
 
 
-    >>>test_param = csv_reader('vacancy_test_data.csv')
-    >>>len(test_param)
+    >>> test_param = csv_reader('vacancy_test_data.csv')
+    >>> len(test_param)
     3
-    >>>test_param[0]['name']
+    >>> test_param[0]['name']
     'Специалист'
-    >>>test_param[1]['area_name']
+    >>> test_param[1]['area_name']
     '<html>Санкт-Петербург</html>'
     """
     global headers, lines
@@ -473,11 +898,175 @@ def csv_filer(lines, headers):
     Returns:
         list: Возвращает корректный список вакансий
     """
-    ans = []
-    for line in lines:
-        if len(line) == len(headers) and line.count('') == 0:
-            ans.append(line)
-    return ans
+    return [line for line in lines if is_correct_line(line, headers)]
+
+
+def is_correct_line(line, headers):
+    """Проверяет, что строка вакансии заполнена полностью
+
+    Args:
+        line (list): Строка вакансии
+        headers (list): Список заголовков
+
+    Returns:
+        bool: Корректна ли строка
+    """
+    return len(line) == len(headers) and line.count('') == 0
+
+
+def csv_stream(file_name):
+    """Построчно читает файл и отдаёт корректные вакансии по одной, не храня файл в памяти
+
+    Args:
+        file_name (str): Название файла
+
+    Yields:
+        dict: Словарь вакансии
+
+    >>> [row['name'] for row in csv_stream('vacancy_test_data.csv')]
+    ['Специалист', 'Программист', 'Аналитик']
+    """
+    with open(file_name, encoding="utf_8_sig") as file:
+        reader = csv.reader(file)
+        try:
+            headers = next(reader)
+        except StopIteration:
+            quick_quit('Пустой файл')
+        for line in reader:
+            if is_correct_line(line, headers):
+                yield dict(zip(headers, line))
+
+
+def get_row_bounds(file_name, targets, block_size=1024 * 1024):
+    """Находит начала строк CSV-файла, ближайшие к заданным байтовым смещениям.
+    Перевод строки внутри кавычек не считается концом строки: чётность кавычек считается
+    последовательно по блокам через bytes.count
+
+    Args:
+        file_name (str): Название файла
+        targets (list[int]): Возрастающие байтовые смещения
+        block_size (int): Размер читаемого блока в байтах
+
+    Returns:
+        list[int]: Смещение начала первой строки после каждого из targets (или размер файла)
+    """
+    size = os.path.getsize(file_name)
+    bounds = []
+    in_quotes = False
+    block_start = 0
+    index = 0
+    with open(file_name, 'rb') as file:
+        block = file.read(block_size)
+        for target in targets:
+            while True:
+                if not block:
+                    bounds.append(size)
+                    break
+                local_target = max(target - block_start, index)
+                newline = block.find(b'\n', local_target) if local_target < len(block) else -1
+                if newline == -1:
+                    in_quotes ^= block.count(b'"', index) % 2 == 1
+                    block_start += len(block)
+                    block = file.read(block_size)
+                    index = 0
+                    continue
+                in_quotes ^= block.count(b'"', index, newline) % 2 == 1
+                index = newline + 1
+                if not in_quotes:
+                    bounds.append(block_start + index)
+                    break
+    return bounds
+
+
+def get_chunks(file_name, chunk_count):
+    """Делит файл на байтовые диапазоны, выровненные по границам строк. Первый диапазон - строка заголовков
+
+    Args:
+        file_name (str): Название файла
+        chunk_count (int): Желаемое количество диапазонов
+
+    Returns:
+        list[tuple]: Список пар (начало, конец)
+    """
+    size = os.path.getsize(file_name)
+    bounds = [0] + get_row_bounds(file_name, [0] + [size * i // chunk_count for i in range(1, chunk_count)]) + [size]
+    return [(start, end) for start, end in zip(bounds, bounds[1:]) if start < end]
+
+
+def get_chunk_data(file_name, start, end, headers, job_name, engine='python'):
+    """Строит частичный результат анализа по байтовому диапазону файла. Выполняется в отдельном процессе
+
+    Args:
+        file_name (str): Название файла
+        start (int): Начало диапазона
+        end (int): Конец диапазона
+        headers (list): Список заголовков
+        job_name (str): Название вводимой профессии
+        engine (str): Движок анализа данных
+
+    Returns:
+        Total: Незавершённый результат анализа части файла
+    """
+    with open(file_name, 'rb') as file:
+        file.seek(start)
+        text = file.read(end - start).decode('utf_8')
+    rows = (dict(zip(headers, line)) for line in csv.reader(io.StringIO(text, newline=None))
+            if is_correct_line(line, headers))
+    total = engines[engine]()
+    total.add_data((Vacancy(row) for row in rows), job_name)
+    return total
+
+
+def parallel_get_data(file_name, job_name, processes=None, engine='python', chunk_size=64 * 1024 * 1024):
+    """Анализ файла в несколько процессов. Частичные результаты объединяются по порядку частей,
+    после чего анализ завершается один раз, поэтому результат совпадает с последовательным
+
+    Args:
+        file_name (str): Название файла
+        job_name (str): Название вводимой профессии
+        processes (int): Количество процессов (по умолчанию по числу ядер)
+        engine (str): Движок анализа данных
+        chunk_size (int): Максимальный размер части файла в байтах
+
+    Returns:
+        Total: Результат анализа
+    """
+    processes = processes or os.cpu_count()
+    chunks = get_chunks(file_name, max(processes, os.path.getsize(file_name) // chunk_size + 1))
+    if not chunks:
+        quick_quit('Пустой файл')
+    with open(file_name, 'rb') as file:
+        headers = next(csv.reader(io.StringIO(file.read(chunks[0][1]).decode('utf_8_sig'), newline='')))
+    total = engines[engine]()
+    with futures.ProcessPoolExecutor(processes) as executor:
+        parts = [executor.submit(get_chunk_data, file_name, start, end, headers, job_name, engine)
+                 for start, end in chunks[1:]]
+        for part in parts:
+            total.merge(part.result())
+    total.job_name = job_name
+    return total.finish_data()
+
+
+def cached_get_data(file_name, job_name, cache=None):
+    """Анализ файла с использованием дискового кэша. Повторный запуск по тому же файлу,
+    в том числе с другой профессией, не читает CSV-файл
+
+    Args:
+        file_name (str): Название файла
+        job_name (str): Название вводимой профессии
+        cache (AggregateCache): Кэш (по умолчанию папка pdf_cache)
+
+    Returns:
+        Total: Результат анализа
+    """
+    cache = cache or AggregateCache()
+    fingerprint = cache.get_fingerprint(file_name)
+    try:
+        cache_data = CacheData.from_json(cache.load(fingerprint))
+    except (KeyError, TypeError, ValueError):
+        cache_data = CacheData().add_data(Vacancy(i) for i in csv_stream(file_name))
+        cache.save(fingerprint, cache_data.to_json())
+    return cache_data.get_total(job_name)
 
 
 def quick_quit(message):
@@ -490,12 +1079,29 @@ def quick_quit(message):
     exit()
 
 
-def pdf_create():
+engines = {
+    'python': Total,
+    'numpy': NumpyTotal,
+}
+
+
+def pdf_create(engine='python', processes=1, use_cache=False, full_excel=False):
     """Метод для создания pdf файла, вызывая другие методы.
 
+    Args:
+        engine (str): Движок анализа данных: 'python' (Total) или 'numpy' (NumpyTotal)
+        processes (int): Количество процессов для чтения файла (None - по числу ядер)
+        use_cache (bool): Использовать дисковый кэш анализа
+        full_excel (bool): Дополнительно выгрузить полную статистику по всем городам в report_full.xlsx
     """
     file_name = input("Введите название файла: ")
     job = input("Введите название профессии: ")
-    data = csv_reader(file_name)
-    if data is not None:
-        Total().get_data([Vacancy(i) for i in data], job).print_result()
\ No newline at end of file
+    if use_cache:
+        total = cached_get_data(file_name, job)
+    elif processes == 1:
+        total = engines[engine]().get_data((Vacancy(i) for i in csv_stream(file_name)), job)
+    else:
+        total = parallel_get_data(file_name, job, processes, engine)
+    total.print_result()
+    if full_excel:
+        total.generate_full_excel()
\ No newline at end of file
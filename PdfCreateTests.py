@@ -1,8 +1,20 @@
+import csv
+import json
+import os
+import tempfile
 from unittest import TestCase
 
 from PdfCreate import Vacancy
 from PdfCreate import Total
+from PdfCreate import NumpyTotal
 from PdfCreate import csv_reader
+from PdfCreate import csv_stream
+from PdfCreate import SalaryDict
+from PdfCreate import get_chunks
+from PdfCreate import parallel_get_data
+from PdfCreate import cached_get_data
+from ProfessionMatcher import ProfessionMatcher
+from AggregateCache import AggregateCache
 
 
 class VacancyTests(TestCase):
@@ -32,6 +44,7 @@ class VacancyTests(TestCase):
 
 
 class TotalTests(TestCase):
+    engine = Total
     vacancy = [Vacancy({
         'name': 'Программист',
         'salary_from': '40000.0',
@@ -42,14 +55,14 @@ class TotalTests(TestCase):
     })]
 
     def test_get_data(self):
-        test_param = Total()
+        test_param = self.engine()
         test_param.get_data(self.vacancy, 'Специалист')
         self.assertEqual(test_param.dynamics_count_by_year.count_dict, {2012: 1})
         self.assertEqual(test_param.dynamics_job_count_city.count_dict, {'Москва': 1})
         self.assertEqual(test_param.dynamics_job_count_year.count_dict, {2012: 0})
-        self.assertEqual(test_param.dynamics_job_salary_city.salary_dictionary, {'Москва': [47500]})
-        self.assertEqual(test_param.dynamics_job_salary_year.salary_dictionary, {2012: [0]})
-        self.assertEqual(test_param.dynamics_salary_by_year.salary_dictionary, {2012: [47500]})
+        self.assertEqual(test_param.dynamics_job_salary_city.salary_dictionary, {'Москва': [47500, 1]})
+        self.assertEqual(test_param.dynamics_job_salary_year.salary_dictionary, {2012: [0, 1]})
+        self.assertEqual(test_param.dynamics_salary_by_year.salary_dictionary, {2012: [47500, 1]})
 
 
 class CsvReaderTests(TestCase):
@@ -59,3 +72,151 @@ class CsvReaderTests(TestCase):
         self.assertEqual(len(self.test_param), 3)
         self.assertEqual(self.test_param[0]['name'], 'Специалист')
         self.assertEqual(self.test_param[1]['area_name'], '<html>Санкт-Петербург</html>')
+
+
+class NumpyTotalTests(TotalTests):
+    engine = NumpyTotal
+
+    def test_same_as_total(self):
+        test_python = Total().get_data([Vacancy(i) for i in csv_reader('vacancy_test_data.csv')], 'Программист')
+        test_numpy = self.engine().get_data([Vacancy(i) for i in csv_reader('vacancy_test_data.csv')], 'Программист')
+        for name in ['dynamics_salary_by_year', 'dynamics_job_salary_year', 'dynamics_job_salary_city']:
+            self.assertEqual(list(getattr(test_numpy, name).salary_dictionary.items()),
+                             list(getattr(test_python, name).salary_dictionary.items()))
+        for name in ['dynamics_count_by_year', 'dynamics_job_count_year', 'dynamics_job_count_city']:
+            self.assertEqual(list(getattr(test_numpy, name).count_dict.items()),
+                             list(getattr(test_python, name).count_dict.items()))
+        self.assertEqual(test_numpy.dynamics_job_count_city.top_percentage_dict,
+                         test_python.dynamics_job_count_city.top_percentage_dict)
+
+
+class SalaryDictTests(TestCase):
+    def test_average_salary(self):
+        test_param = SalaryDict()
+        for salary in [100, 200, 301]:
+            test_param.add(2012, salary)
+        self.assertEqual(test_param.salary_dictionary, {2012: [601, 3]})
+        self.assertEqual(test_param.average_salary(), {2012: 200})
+
+
+class CsvStreamTests(TestCase):
+    def test_csv_stream(self):
+        self.assertEqual(list(csv_stream('vacancy_test_data.csv')), csv_reader('vacancy_test_data.csv'))
+
+    def test_get_data_stream(self):
+        test_list = Total().get_data([Vacancy(i) for i in csv_reader('vacancy_test_data.csv')], 'Программист')
+        test_stream = Total().get_data((Vacancy(i) for i in csv_stream('vacancy_test_data.csv')), 'Программист')
+        self.assertEqual(test_stream.dynamics_salary_by_year.salary_dictionary,
+                         test_list.dynamics_salary_by_year.salary_dictionary)
+        self.assertEqual(test_stream.dynamics_job_count_year.count_dict, test_list.dynamics_job_count_year.count_dict)
+        self.assertEqual(test_stream.dynamics_job_count_city.top_percentage_dict,
+                         test_list.dynamics_job_count_city.top_percentage_dict)
+
+
+class BatchTotalTests(TestCase):
+    job_names = ['Программист', 'Специалист', 'ист', 'Повар']
+
+    def test_same_as_total(self):
+        totals = Total.get_batch_data((Vacancy(i) for i in csv_stream('vacancy_test_data.csv')), self.job_names)
+        for job_name in self.job_names:
+            test_param = Total().get_data([Vacancy(i) for i in csv_reader('vacancy_test_data.csv')], job_name)
+            self.assertEqual(totals[job_name].dynamics_job_salary_year.salary_dictionary,
+                             test_param.dynamics_job_salary_year.salary_dictionary)
+            self.assertEqual(totals[job_name].dynamics_job_count_year.count_dict,
+                             test_param.dynamics_job_count_year.count_dict)
+            self.assertEqual(totals[job_name].dynamics_job_count_city.top_percentage_dict,
+                             test_param.dynamics_job_count_city.top_percentage_dict)
+
+    def test_profession_matcher(self):
+        names = ['Старший программист', 'Программист 1С', 'Специалист по продажам', 'Су-шеф', 'Повар']
+        matcher = ProfessionMatcher(self.job_names)
+        for name in names:
+            self.assertEqual(matcher.find(name), {job_name for job_name in self.job_names if job_name in name})
+
+
+def create_test_file():
+    file, file_name = tempfile.mkstemp(suffix='.csv')
+    with os.fdopen(file, 'w', encoding='utf_8_sig', newline='') as csv_file:
+        writer = csv.writer(csv_file)
+        writer.writerow(['name', 'salary_from', 'salary_to', 'salary_currency', 'area_name', 'published_at'])
+        for index in range(300):
+            writer.writerow([['Программист', 'Аналитик "Data"', 'Тестировщик\nпрограммист'][index % 3],
+                             '' if index % 7 == 0 else str(1000 + index), str(5000 + index),
+                             ['RUR', 'USD'][index % 2], ['Москва', 'Тула', 'Омск'][index % 5 % 3],
+                             f'{2013 - index % 4}-04-09T13:49:00+0400'])
+    return file_name
+
+
+class ParallelTests(TestCase):
+    def setUp(self):
+        self.file_name = create_test_file()
+
+    def tearDown(self):
+        os.remove(self.file_name)
+
+    def test_chunks(self):
+        chunks = get_chunks(self.file_name, 10)
+        self.assertEqual(chunks[0][0], 0)
+        self.assertEqual(chunks[-1][1], os.path.getsize(self.file_name))
+        with open(self.file_name, 'rb') as file:
+            data = file.read()
+        for start, end in chunks:
+            self.assertEqual(data[:start].count(b'"') % 2, 0)
+
+    def test_same_as_serial(self):
+        test_serial = Total().get_data((Vacancy(i) for i in csv_stream(self.file_name)), 'программист')
+        test_parallel = parallel_get_data(self.file_name, 'программист', 2, chunk_size=1000)
+        self.assertEqual(list(test_parallel.dynamics_salary_by_year.salary_dictionary.items()),
+                         list(test_serial.dynamics_salary_by_year.salary_dictionary.items()))
+        self.assertEqual(test_parallel.dynamics_job_count_year.count_dict, test_serial.dynamics_job_count_year.count_dict)
+        self.assertEqual(test_parallel.dynamics_job_salary_city.salary_dictionary,
+                         test_serial.dynamics_job_salary_city.salary_dictionary)
+        self.assertEqual(test_parallel.dynamics_job_count_city.top_percentage_dict,
+                         test_serial.dynamics_job_count_city.top_percentage_dict)
+
+
+class CacheTests(TestCase):
+    def setUp(self):
+        self.file_name = create_test_file()
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.cache = AggregateCache(self.cache_dir.name)
+
+    def tearDown(self):
+        os.remove(self.file_name)
+        self.cache_dir.cleanup()
+
+    def test_same_as_serial(self):
+        for job_name in ['программист', 'Аналитик', 'Повар', 'программист']:
+            test_serial = Total().get_data((Vacancy(i) for i in csv_stream(self.file_name)), job_name)
+            test_cached = cached_get_data(self.file_name, job_name, self.cache)
+            for name in ['dynamics_salary_by_year', 'dynamics_job_salary_year', 'dynamics_job_salary_city']:
+                self.assertEqual(list(getattr(test_cached, name).salary_dictionary.items()),
+                                 list(getattr(test_serial, name).salary_dictionary.items()))
+            for name in ['dynamics_count_by_year', 'dynamics_job_count_year', 'dynamics_job_count_city']:
+                self.assertEqual(list(getattr(test_cached, name).count_dict.items()),
+                                 list(getattr(test_serial, name).count_dict.items()))
+            self.assertEqual(test_cached.dynamics_job_count_city.city_list, test_serial.dynamics_job_count_city.city_list)
+        self.assertEqual(len(os.listdir(self.cache_dir.name)), 1)
+
+    def test_changed_file(self):
+        cached_get_data(self.file_name, 'программист', self.cache)
+        with open(self.file_name, 'a', encoding='utf_8') as csv_file:
+            csv_file.write('Повар,100.0,200.0,RUR,Москва,2013-04-09T13:49:00+0400\n')
+        self.assertEqual(cached_get_data(self.file_name, 'Повар', self.cache).dynamics_job_count_year.count_dict[2013], 1)
+        self.assertEqual(len(os.listdir(self.cache_dir.name)), 2)
+
+    def test_untrusted_entry(self):
+        expected = cached_get_data(self.file_name, 'программист', self.cache).dynamics_job_salary_year.salary_dictionary
+        path = self.cache.get_path(self.cache.get_fingerprint(self.file_name))
+        for content in ['not json', '[1, 2]', '{"salary": {}}']:
+            with open(path, 'w', encoding='utf_8') as file:
+                file.write(content)
+            result = cached_get_data(self.file_name, 'программист', self.cache)
+            self.assertEqual(result.dynamics_job_salary_year.salary_dictionary, expected)
+        with open(path, encoding='utf_8') as file:
+            self.assertEqual(list(json.load(file)), ['salary', 'count', 'names'])
+
+    def test_evict(self):
+        self.cache.max_size = 0
+        cached_get_data(self.file_name, 'программист', self.cache)
+        self.assertEqual(os.listdir(self.cache_dir.name), [])
@@ -0,0 +1,84 @@
+from collections import deque
+
+
+class ProfessionMatcher:
+    """Автомат Ахо-Корасик для поиска сразу нескольких профессий в названии вакансии.
+    Время поиска зависит от длины названия, а не от количества профессий
+
+    Attributes:
+        goto (list[dict]): Переходы автомата по символам
+        fail (list[int]): Суффиксные ссылки
+        output (list[set]): Профессии, найденные при попадании в состояние
+    """
+    def __init__(self, patterns):
+        """Инициализирует объекты ProfessionMatcher
+
+        Args:
+            patterns (list[str]): Названия профессий
+
+        >>> sorted(ProfessionMatcher(['Программист', 'Аналитик', 'Python']).find('Аналитик-программист Python'))
+        ['Python', 'Аналитик']
+        """
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [set()]
+        for pattern in patterns:
+            self.add(pattern)
+        self.build()
+
+    def add(self, pattern):
+        """Добавляет профессию в бор
+
+        Args:
+            pattern (str): Название профессии
+        """
+        state = 0
+        for char in pattern:
+            next_state = self.goto[state].get(char)
+            if next_state is None:
+                next_state = len(self.goto)
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append(set())
+                self.goto[state][char] = next_state
+            state = next_state
+        self.output[state].add(pattern)
+
+    def build(self):
+        """Строит суффиксные ссылки обходом бора в ширину
+        """
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+                fail = self.fail[state]
+                while fail and char not in self.goto[fail]:
+                    fail = self.fail[fail]
+                self.fail[next_state] = self.goto[fail].get(char, 0)
+                self.output[next_state] |= self.output[self.fail[next_state]]
+
+    def find(self, text):
+        """Ищет все профессии, входящие в текст как подстроки
+
+        Args:
+            text (str): Название вакансии
+
+        Returns:
+            set: Найденные профессии
+
+        >>> sorted(ProfessionMatcher(['he', 'she', 'his', 'hers']).find('ushers'))
+        ['he', 'hers', 'she']
+        >>> ProfessionMatcher(['', 'x']).find('')
+        {''}
+        """
+        goto, fail, output = self.goto, self.fail, self.output
+        state = 0
+        found = set(output[0])
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found |= output[state]
+        return found
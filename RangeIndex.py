@@ -0,0 +1,106 @@
+from bisect import bisect_left, bisect_right
+
+
+class RangeIndex:
+    """Индекс по упорядоченным значениям для запросов вида start <= значение <= end.
+    Значения сортируются один раз, запрос отвечается двумя бинарными поисками
+
+    Attributes:
+        keys (list): Отсортированные значения
+        ids (list): Номера записей в порядке keys
+    """
+    def __init__(self, values):
+        """Инициализирует объекты RangeIndex
+
+        Args:
+            values (list): Значения в порядке записей
+
+        >>> RangeIndex([5, 1, 3, 3]).find(2, 3)
+        [2, 3]
+        """
+        pairs = sorted((value, record_id) for record_id, value in enumerate(values))
+        self.keys = [pair[0] for pair in pairs]
+        self.ids = [pair[1] for pair in pairs]
+
+    def find(self, start, end):
+        """Возвращает номера записей со значением в диапазоне [start, end]
+
+        Args:
+            start (any): Начало диапазона
+            end (any): Конец диапазона
+
+        Returns:
+            list: Номера записей по возрастанию
+        """
+        return sorted(self.ids[bisect_left(self.keys, start):bisect_right(self.keys, end)])
+
+
+class IntervalIndex:
+    """Центрированное дерево интервалов для запросов вида начало <= x <= конец.
+    В каждом узле хранятся интервалы, содержащие его центр, отсортированные по началу и по концу,
+    поэтому запрос спускается по дереву и в каждом узле отвечается бинарным поиском
+
+    Attributes:
+        root (tuple): Корень дерева: центр, начала, номера по началу, концы, номера по концу, левое и правое поддерево
+    """
+    def __init__(self, intervals):
+        """Инициализирует объекты IntervalIndex
+
+        Args:
+            intervals (list): Пары (начало, конец) в порядке записей
+
+        >>> IntervalIndex([(1, 5), (4, 8), (6, 7), (9, 3)]).find(4.5)
+        [0, 1]
+        """
+        self.root = self.build([(start, end, record_id) for record_id, (start, end) in enumerate(intervals)
+                                if start <= end])
+
+    def build(self, intervals):
+        """Строит поддерево по списку интервалов
+
+        Args:
+            intervals (list): Тройки (начало, конец, номер записи)
+
+        Returns:
+            tuple: Узел дерева или None, если интервалов нет
+        """
+        if len(intervals) == 0:
+            return None
+        center = sorted(interval[0] for interval in intervals)[len(intervals) // 2]
+        left, middle, right = [], [], []
+        for interval in intervals:
+            if interval[1] < center:
+                left.append(interval)
+            elif interval[0] > center:
+                right.append(interval)
+            else:
+                middle.append(interval)
+        by_start = sorted(middle)
+        by_end = sorted(middle, key=lambda interval: interval[1])
+        return (center, [interval[0] for interval in by_start], [interval[2] for interval in by_start],
+                [interval[1] for interval in by_end], [interval[2] for interval in by_end],
+                self.build(left), self.build(right))
+
+    def find(self, point):
+        """Возвращает номера записей, интервал которых содержит точку
+
+        Args:
+            point (float): Точка
+
+        Returns:
+            list: Номера записей по возрастанию
+        """
+        result = []
+        node = self.root
+        while node is not None:
+            center, starts, start_ids, ends, end_ids, left, right = node
+            if point < center:
+                result.extend(start_ids[:bisect_right(starts, point)])
+                node = left
+            elif point > center:
+                result.extend(end_ids[bisect_left(ends, point):])
+                node = right
+            else:
+                result.extend(start_ids)
+                break
+        return sorted(result)
@@ -0,0 +1,125 @@
+import sqlite3
+from datetime import date, datetime
+
+import pandas as pd
+
+
+class RateStore:
+    """Постоянное хранилище курсов валют ЦБ РФ на первое число месяца в базе SQLite.
+    Курсы прошедших месяцев не меняются, поэтому загружаются только месяцы и валюты, которых ещё нет в базе.
+    Отсутствие валюты в ответе ЦБ РФ тоже сохраняется, чтобы не запрашивать её повторно
+
+    Attributes:
+        connect (Connection): Соединение с базой
+    """
+    def __init__(self, path='exchange_rates.sqlite'):
+        """Инициализирует объекты RateStore
+
+        Args:
+            path (str): Путь к файлу базы
+        """
+        self.connect = sqlite3.connect(path)
+        self.connect.execute('CREATE TABLE IF NOT EXISTS rates (month TEXT, currency TEXT, rate REAL, '
+                             'PRIMARY KEY (month, currency)) WITHOUT ROWID')
+
+    def close(self):
+        """Закрывает соединение с базой
+        """
+        self.connect.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @staticmethod
+    def get_month(date_str):
+        """Переводит месяц из формата запроса в формат базы
+
+        Args:
+            date_str (str): Месяц в формате 'MM/YYYY'
+
+        Returns:
+            str: Месяц в формате 'YYYY-MM'
+
+        >>> RateStore.get_month('07/2005')
+        '2005-07'
+        """
+        return datetime.strptime(date_str, '%m/%Y').strftime('%Y-%m')
+
+    def get_missing_dates(self, dates_list, currency_list):
+        """Возвращает месяцы, для которых в базе есть не все валюты
+
+        Args:
+            dates_list (list): Месяцы в формате 'MM/YYYY'
+            currency_list (list): Коды валют
+
+        Returns:
+            list: Месяцы в формате 'MM/YYYY' в исходном порядке
+        """
+        placeholders = ', '.join('?' * len(currency_list))
+        stored = dict(self.connect.execute(f'SELECT month, COUNT(*) FROM rates WHERE currency IN ({placeholders}) '
+                                           f'GROUP BY month', currency_list))
+        return [x for x in dates_list if stored.get(self.get_month(x), 0) < len(set(currency_list))]
+
+    def update(self, fetcher, dates_list, currency_list):
+        """Загружает недостающие курсы и сохраняет их в базу.
+        Курсы месяцев, которые ещё не начались, не сохраняются: ЦБ РФ отдаёт на такие даты последний курс
+
+        Args:
+            fetcher (AsyncRateFetcher): Загрузчик курсов
+            dates_list (list): Месяцы в формате 'MM/YYYY'
+            currency_list (list): Коды валют
+
+        Returns:
+            DataFrame: Загруженные курсы в формате AsyncRateFetcher.get_rates или None, если всё уже есть в базе
+        """
+        missing = self.get_missing_dates(dates_list, currency_list)
+        if len(missing) == 0:
+            return None
+        currency_list = sorted(set(currency_list))
+        rates = fetcher.get_rates(missing, currency_list)
+        this_month = date.today().strftime('%Y-%m')
+        rows = [(month, currency, None if rate == '' else rate)
+                for month, *values in rates.itertuples(index=False) if month <= this_month
+                for currency, rate in zip(currency_list, values)]
+        with self.connect:
+            self.connect.executemany('INSERT OR REPLACE INTO rates VALUES (?, ?, ?)', rows)
+        return rates
+
+    def get_rate(self, month, currency):
+        """Возвращает курс валюты на первое число месяца
+
+        Args:
+            month (str): Месяц в формате 'YYYY-MM'
+            currency (str): Код валюты
+
+        Returns:
+            float: Курс или None, если курса нет
+        """
+        row = self.connect.execute('SELECT rate FROM rates WHERE month = ? AND currency = ?',
+                                   (month, currency)).fetchone()
+        return None if row is None else row[0]
+
+    def get_rates(self, dates_list, currency_list, fetched=None):
+        """Возвращает курсы валют из базы в формате AsyncRateFetcher.get_rates
+
+        Args:
+            dates_list (list): Месяцы в формате 'MM/YYYY'
+            currency_list (list): Коды валют
+            fetched (DataFrame): Курсы, загруженные, но не сохранённые в базу
+
+        Returns:
+            DataFrame: Фрейм с месяцем в формате 'YYYY-MM' и курсами валют, '' если курса нет
+        """
+        months = [self.get_month(x) for x in dates_list]
+        placeholders = ', '.join('?' * len(currency_list))
+        rates = {(month, currency): '' if rate is None else rate for month, currency, rate in self.connect.execute(
+            f'SELECT month, currency, rate FROM rates WHERE currency IN ({placeholders}) AND month BETWEEN ? AND ?',
+            currency_list + [min(months, default=''), max(months, default='')])}
+        if fetched is not None:
+            for month, *values in fetched.itertuples(index=False):
+                rates.update(((month, currency), rate) for currency, rate in zip(fetched.columns[1:], values))
+        return pd.DataFrame([[month] + [rates.get((month, currency), '') for currency in currency_list]
+                             for month in months], columns=['date'] + currency_list)
@@ -1,8 +1,13 @@
-import datetime
 import os
 from prettytable import PrettyTable
 import csv
-import re
+import functools
+import heapq
+from datetime import datetime
+
+from DateParser import parse_datetime
+from HtmlCleaner import HtmlCleaner
+from RangeIndex import IntervalIndex, RangeIndex
 
 experience_sort = {
     'Нет опыта': 0,
@@ -54,6 +59,17 @@ currency_to_rub = {
     "Узбекский сум": 0.0055,
 }
 
+value_formatters = {
+    'experience_id': experience,
+    'premium': premium,
+    'salary_currency': currency,
+}
+
+indexed_columns = ["Название", "Опыт работы", "Премиум-вакансия", "Компания", "Название региона",
+                   "Идентификатор валюты оклада"]
+
+html_cleaner = HtmlCleaner()
+
 translator = {
     'Название': 'name',
     'Описание': 'description',
@@ -79,6 +95,7 @@ class UserInput:
         sort_param (str): Параметр сортировки
         reverse_sort_param (str): Обратная сортировка
         distance_param (str): Диапозон вывода
+        page_size (int): Размер страницы при постраничном выводе, None если вывод не постраничный
         columns_param (str): Столбцы вывода
     """
     sort_phrases = ["Название", "Описание", "Навыки", "Опыт работы",
@@ -92,7 +109,7 @@ class UserInput:
         self.filter_param = input("Введите параметр фильтрации: ")
         self.sort_param = input("Введите параметр сортировки: ")
         self.reverse_sort_param = input("Обратный порядок сортировки (Да / Нет): ")
-        self.distance_param = input("Введите диапазон вывода: ").split()
+        self.distance_param, self.page_size = self.check_distance_param(input("Введите диапазон вывода: ").split())
         self.columns_param = self.check_names(input("Введите требуемые столбцы: ").split(", "))
         self.filter_param = self.check_filter_param(self.filter_param)
         self.sort_param = self.check_sort_param(self.sort_param)
@@ -111,6 +128,11 @@ class UserInput:
 
         if filter_param != "" and filter_param.split(": ")[0] not in self.sort_phrases:
             quick_quit("Параметр поиска некорректен")
+        if filter_param.startswith("Дата публикации вакансии: ") and " - " in filter_param:
+            try:
+                get_date_range(filter_param.split(": ")[1])
+            except ValueError:
+                quick_quit("Диапазон дат некорректен")
         return filter_param
 
     def check_sort_param(self, sort_param):
@@ -121,10 +143,25 @@ class UserInput:
         Returns:
             str: Текст ошибки или передаваемый параметр сортировки, в случае отсутствия ошибки
         """
-        if sort_param != "" and sort_param not in self.sort_phrases:
+        if sort_param != "" and any(name not in self.sort_phrases for name in sort_param.split(", ")):
             quick_quit("Параметр сортировки некорректен")
         return sort_param
 
+    @staticmethod
+    def check_distance_param(distance_param):
+        """Проверка диапазона вывода. Ввод вида "по 20" включает постраничный вывод по 20 вакансий
+        Args:
+            distance_param (list): Диапозон вывода
+
+        Returns:
+            tuple: Диапозон вывода и размер страницы(None, если вывод не постраничный)
+        """
+        if len(distance_param) == 0 or distance_param[0] != "по":
+            return distance_param, None
+        if len(distance_param) != 2 or not distance_param[1].isdigit() or int(distance_param[1]) == 0:
+            quick_quit("Размер страницы некорректен")
+        return [], int(distance_param[1])
+
     @staticmethod
     def check_reverse_sort_param(reverse_sort_param):
         """Проверка обратной сортировка
@@ -153,12 +190,81 @@ class UserInput:
         return headers
 
 
+class SkillIndex:
+    """Класс словаря навыков. Каждая строка навыков разбирается один раз и превращается в битовую маску,
+    где каждому навыку соответствует свой бит
+    Attributes:
+        vocabulary (dict): Словарь навык:номер бита
+        masks (dict): Словарь исходная строка навыков:битовая маска
+        counts (dict): Словарь исходная строка навыков:количество навыков
+    """
+    def __init__(self):
+        """Инициализирует объекты SkillIndex
+
+        """
+        self.vocabulary = {}
+        self.masks = {}
+        self.counts = {}
+
+    def get_mask(self, key_skills):
+        """Возвращает битовую маску навыков вакансии, разбирая строку навыков при первом обращении
+        Args:
+            key_skills (str): Исходная строка навыков
+
+        Returns:
+            int: Битовая маска навыков
+        """
+        mask = self.masks.get(key_skills)
+        if mask is None:
+            skills = parse_html(key_skills)
+            skills = skills if type(skills) == list else [skills]
+            mask = 0
+            for skill in skills:
+                mask |= 1 << self.vocabulary.setdefault(skill, len(self.vocabulary))
+            self.masks[key_skills] = mask
+            self.counts[key_skills] = len(skills)
+        return mask
+
+    def get_count(self, key_skills):
+        """Возвращает количество навыков вакансии
+        Args:
+            key_skills (str): Исходная строка навыков
+
+        Returns:
+            int: Количество навыков
+        """
+        self.get_mask(key_skills)
+        return self.counts[key_skills]
+
+    def get_required_mask(self, skills):
+        """Возвращает битовую маску требуемых навыков
+        Args:
+            skills (list): Требуемые навыки
+
+        Returns:
+            int: Битовая маска или None, если какого-то навыка нет ни у одной разобранной вакансии
+        """
+        mask = 0
+        for skill in skills:
+            if skill not in self.vocabulary:
+                return None
+            mask |= 1 << self.vocabulary[skill]
+        return mask
+
+
+skill_index = SkillIndex()
+
+
 class DataSet:
     """Класс чтения и подготовки данных из CSV-файла
     Attributes:
         data (list): Все данные
         names (str): Заголовки
         all_data (list): Все вакансии
+        indexes (dict): Индексы столбцов: инвертированные {значение: номера вакансий} для категориальных,
+            IntervalIndex для оклада и RangeIndex для даты публикации
+        sort_keys (dict): Типизированные ключи сортировки по столбцам в порядке вакансий
+        skill_masks (list): Битовые маски навыков вакансий, None пока не построены
     """
     def __init__(self, file_name):
         """Проверяет пустоту файла и инициализирует объекты DataSet
@@ -174,52 +280,192 @@ class DataSet:
         self.all_data = [row for row in self.data[1:] if len(row) == len(self.names) and row.count("") == 0]
         if len(self.all_data) == 0:
             quick_quit("Нет данных")
+        self.indexes = {}
+        self.sort_keys = {}
+        self.skill_masks = None
+        html_cleaner.load(file_name)
+
+    def get_index(self, key):
+        """Возвращает инвертированный индекс по категориальному столбцу, строя его при первом обращении.
+        Ключи индекса - значения в том виде, в каком их сравнивает filter_condition
+
+        Args:
+            key (str): Название столбца на русском
+
+        Returns:
+            dict: Словарь значение:список номеров вакансий
+        """
+        if key not in self.indexes:
+            column = translator[key]
+            position = self.names.index(column)
+            formatter = value_formatters.get(column)
+            index = {}
+            for row_id, row in enumerate(self.all_data):
+                value = parse_html(row[position])
+                if type(value) == list:
+                    continue
+                if formatter is not None:
+                    value = formatter[value]
+                index.setdefault(value, []).append(row_id)
+            self.indexes[key] = index
+        return self.indexes[key]
+
+    def get_sort_keys(self, key):
+        """Возвращает ключи сортировки всех вакансий по столбцу, вычисляя их при первом обращении,
+        поэтому повторные запросы не разбирают даты и не очищают html заново
+
+        Args:
+            key (str): Название столбца на русском
+
+        Returns:
+            list: Ключи get_sort_func в порядке вакансий
+        """
+        if key not in self.sort_keys:
+            self.sort_keys[key] = [get_sort_func(Vacancy(dict(zip(self.names, row))), key) for row in self.all_data]
+        return self.sort_keys[key]
+
+    def get_skill_masks(self):
+        """Возвращает битовые маски навыков всех вакансий, разбирая навыки при первом обращении
+
+        Returns:
+            list: Битовые маски навыков в порядке вакансий
+        """
+        if self.skill_masks is None:
+            position = self.names.index("key_skills")
+            self.skill_masks = [skill_index.get_mask(row[position]) for row in self.all_data]
+        return self.skill_masks
+
+    def get_range_index(self, key):
+        """Возвращает индекс по окладу или дате публикации, строя его при первом обращении.
+        Оклад индексируется как интервал [salary_from, salary_to], дата - как день публикации
+
+        Args:
+            key (str): Название столбца на русском (Оклад/Дата публикации вакансии)
+
+        Returns:
+            IntervalIndex or RangeIndex: Индекс столбца
+        """
+        if key not in self.indexes:
+            if key == "Оклад":
+                salary_from, salary_to = self.names.index("salary_from"), self.names.index("salary_to")
+                self.indexes[key] = IntervalIndex([(int(float(row[salary_from])), int(float(row[salary_to])))
+                                                   for row in self.all_data])
+            else:
+                position = self.names.index("published_at")
+                self.indexes[key] = RangeIndex([parse_datetime(row[position]).date() for row in self.all_data])
+        return self.indexes[key]
+
+    def select_row_ids(self, filter_param):
+        """Отбирает номера строк, которые могут пройти фильтр. Для категориальных столбцов
+        ответ берётся из инвертированного индекса, для навыков - из битовых масок,
+        для оклада и даты публикации - бинарным поиском по индексу, иначе возвращаются все строки
+
+        Args:
+            filter_param (str): Параметр фильтрации
+
+        Returns:
+            list: Номера строк вакансий по возрастанию
+        """
+        if filter_param == "":
+            return range(len(self.all_data))
+        key, value = filter_param.split(": ")
+        if key == "Навыки" and "key_skills" in self.names:
+            masks = self.get_skill_masks()
+            required = skill_index.get_required_mask(value.split(", "))
+            if required is None:
+                return []
+            return [row_id for row_id, mask in enumerate(masks) if mask & required == required]
+        if key == "Оклад" and "salary_from" in self.names and "salary_to" in self.names:
+            return self.get_range_index(key).find(float(value))
+        if key == "Дата публикации вакансии" and "published_at" in self.names:
+            try:
+                start, end = get_date_range(value)
+            except ValueError:
+                return []
+            return self.get_range_index(key).find(start, end)
+        if key not in indexed_columns or translator[key] not in self.names:
+            return range(len(self.all_data))
+        return self.get_index(key).get(value, [])
+
+    def select_rows(self, filter_param):
+        """Отбирает строки, которые могут пройти фильтр
+
+        Args:
+            filter_param (str): Параметр фильтрации
+
+        Returns:
+            list: Строки вакансий
+        """
+        if filter_param == "":
+            return self.all_data
+        return [self.all_data[row_id] for row_id in self.select_row_ids(filter_param)]
+
+    def get_vacancies(self, filter_param, sort_param, reverse_sort_param, limit=None):
+        """Отбирает и сортирует вакансии как get_vacancies для сервера запросов. Ключи сортировки столбца
+        берутся из get_sort_keys, если они уже построены или отобрана хотя бы четверть вакансий,
+        иначе вычисляются только для отобранных вакансий
+
+        Args:
+            filter_param (str): Параметр фильтрации
+            sort_param (str): Параметр сортировки
+            reverse_sort_param (bool): Обратная сортировка
+            limit (int): Сколько первых вакансий после сортировки нужно для вывода, None если все
+
+        Returns:
+            list: лист с вакансиями
+        """
+        row_ids = self.select_row_ids(filter_param)
+        data, positions = filter_vacancies([self.all_data[row_id] for row_id in row_ids], filter_param, self.names)
+        if sort_param == "":
+            return data
+        key_columns = []
+        for name in sort_param.split(", "):
+            if name in self.sort_keys or len(data) * 4 >= len(self.all_data):
+                keys = self.get_sort_keys(name)
+                key_columns.append([keys[row_ids[position]] for position in positions])
+            else:
+                key_columns.append([get_sort_func(vacancy, name) for vacancy in data])
+        return sort_vacancies(data, sort_param, reverse_sort_param, limit, key_columns)
 
 
 class Vacancy:
-    """ Класс установки всех основных полей вакансии
+    """ Класс вакансии. Хранит значения полей в исходном виде: фильтрация и сортировка идут по ним,
+    а человекочитаемый вид строится только для выводимых вакансий.
+    Поля хранятся в __slots__, поэтому у вакансии нет собственного словаря атрибутов,
+    столбцы файла, которых нет в __slots__, не сохраняются
     Attributes:
         name (str): Название вакансии
         description (str): Описание вакансии
-        key_skills (str or list): Навыки
-        experience_id (str): Опыт работы
+        key_skills (str): Навыки
+        experience_id (str): Идентификатор опыта работы
         premium (str): Премиум вакансия
         employer_name (str):
-        salary_from (str): Нижняя граница зарплаты
-        salary_to (str): Верхняя граница зарплаты
-        salary_gross (str): Размер заработной платы до вычета всех налогов(да или нет)
-        salary_currency (str): Валюта, в которой указана зарплата
+        salary_from (int): Нижняя граница зарплаты
+        salary_to (int): Верхняя граница зарплаты
+        salary_gross (str): Размер заработной платы до вычета всех налогов(True или False)
+        salary_currency (str): Код валюты, в которой указана зарплата
         area_name (str): Название города
-        full_published_time (str): Полное время публикации
-        published_at (str):  Сокращённая дата публикации
-        salary (str): Зарплата
+        published_at (str): Дата публикации
     """
+    __slots__ = ("name", "description", "key_skills", "experience_id", "premium", "employer_name", "salary_from",
+                 "salary_to", "salary_gross", "salary_currency", "area_name", "published_at")
+    fields = frozenset(__slots__)
+
     def __init__(self, pers_data):
         """ Инициализирует объекты Vacancy
 
         Args:
-            pers_data (dict): Данные по всем вакансиям
+            pers_data (dict): Данные вакансии
         """
-        self.name = str
-        self.description = str
-        self.key_skills = str or list
-        self.experience_id = str
-        self.premium = str
-        self.employer_name = str
-        self.salary_from = str
-        self.salary_to = str
-        self.salary_gross = str
-        self.salary_currency = str
-        self.area_name = str
-        self.full_published_time = str
-        self.published_at = str
-        self.salary = str
         for key, value in pers_data.items():
-            self.__setattr__(key, self.formatter(key, value))
-
-        self.salary = f'{self.salary_from} - {self.salary_to} ({self.salary_currency}) ({self.salary_gross})'
+            if key not in self.fields:
+                continue
+            if key == "salary_from" or key == "salary_to":
+                value = int(float(value))
+            setattr(self, key, value)
 
-    def formatter(self, key, value):
+    @staticmethod
+    def formatter(key, value):
         """ Метод для форматирования значения передоваемого ключа
         Args:
             key (str): Ключ
@@ -240,12 +486,32 @@ class Vacancy:
         elif key == "salary_to" or key == "salary_from":
             return "{:,}".format(int(float(value))).replace(",", " ")
         elif key == "published_at":
-            self.full_published_time = datetime.datetime.strptime(value, "%Y-%m-%dT%H:%M:%S%z").strftime("%d.%m.%Y-%H"
-                                                                                                         ":%M:%S")
-            return datetime.datetime.strptime(value, "%Y-%m-%dT%H:%M:%S%z").strftime("%d.%m.%Y")
+            return parse_datetime(value).strftime("%d.%m.%Y")
         else:
             return value
 
+    def get_value(self, key):
+        """ Метод для получения поля вакансии в том виде, в каком оно выводится в таблице
+        Args:
+            key (str): Ключ
+        Returns:
+            str: Отформатированное значение поля
+        """
+        if key == "salary":
+            return f'{self.get_value("salary_from")} - {self.get_value("salary_to")} ' \
+                   f'({self.get_value("salary_currency")}) ({self.get_value("salary_gross")})'
+        value = getattr(self, key)
+        if type(value) == str:
+            value = parse_html(value)
+        return self.formatter(key, value)
+
+    def get_timestamp(self):
+        """ Метод для получения момента публикации
+        Returns:
+            float: Время публикации в секундах от начала эпохи, с учётом часового пояса
+        """
+        return parse_datetime(self.published_at).timestamp()
+
     def filter_condition(self, filter_param):
         """Метод для проверки соответствия параметру фильтрации
         Args:
@@ -257,16 +523,16 @@ class Vacancy:
             return True
         key, value = filter_param.split(": ")
         if key == "Оклад":
-            return float(self.salary_from.replace(' ', '')) <= float(value) <= float(self.salary_to.replace(" ", ""))
-        elif key == "Идентификатор валюты оклада":
-            return self.salary_currency == value
+            return self.salary_from <= float(value) <= self.salary_to
+        elif key == "Дата публикации вакансии" and " - " in value:
+            start, end = get_date_range(value)
+            return start <= parse_datetime(self.published_at).date() <= end
         elif key == "Навыки":
-            for skill in value.split(", "):
-                if skill not in self.key_skills.split("\n"):
-                    return False
-            return True
+            mask = skill_index.get_mask(self.key_skills)
+            required = skill_index.get_required_mask(value.split(", "))
+            return required is not None and mask & required == required
         else:
-            return self.__dict__[translator[key]] == value
+            return self.get_value(translator[key]) == value
 
 
 class Table:
@@ -285,26 +551,38 @@ class Table:
         self.table.align = "l"
         self.table.max_width = 20
 
-    def print(self, all_data, start, end, list_names):
-        """ Визуализация таблицы
+    def get_string(self, all_data, start, end, list_names):
+        """ Формирование таблицы в виде строки. Форматируются только вакансии из диапазона вывода
         Args:
             all_data (list): Все вакансии
             start (int): Начала обрезки таблицы
             end (int): Конец обрезки таблицы
             list_names (list): Колонки таблицы
+        Returns:
+            str: Таблица
         """
-        for index, data in enumerate(all_data):
+        for index, data in enumerate(all_data[start:end], start):
             row = [index + 1]
             for name in self.table.field_names[1:]:
-                data_value = data.__dict__[translator[name]]
+                data_value = data.get_value(translator[name])
                 if len(data_value) > 100:
                     data_value = data_value[:100] + "..."
                 row.append(data_value)
             self.table.add_row(row)
-        print(self.table.get_string(start=start, end=end, fields=list_names))
+        return self.table.get_string(fields=list_names)
+
+    def print(self, all_data, start, end, list_names):
+        """ Визуализация таблицы
+        Args:
+            all_data (list): Все вакансии
+            start (int): Начала обрезки таблицы
+            end (int): Конец обрезки таблицы
+            list_names (list): Колонки таблицы
+        """
+        print(self.get_string(all_data, start, end, list_names))
 
 
-def get_vacancies(all_data, filter_param, sort_param, reverse_sort_param, names):
+def get_vacancies(all_data, filter_param, sort_param, reverse_sort_param, names, limit=None):
     """ Метод получения вакансии
     Args:
         all_data (list): Все вакансии
@@ -312,60 +590,110 @@ def get_vacancies(all_data, filter_param, sort_param, reverse_sort_param, names)
         sort_param (str): Параметр сортировки
         reverse_sort_param (boll): Обратная сортировка
         names (list): Заголовки
+        limit (int): Сколько первых вакансий после сортировки нужно для вывода, None если все
     Returns:
         list: лист с вакансиями
     """
-    data = []
-    for pers_data in all_data:
-        parsed_data = Vacancy(dict(zip(names, map(parse_html, pers_data))))
+    data, _ = filter_vacancies(all_data, filter_param, names)
+    return sort_vacancies(data, sort_param, reverse_sort_param, limit)
+
+
+def filter_vacancies(all_data, filter_param, names):
+    """ Метод отбора вакансий, подходящих под параметр фильтрации
+    Args:
+        all_data (list): Строки вакансий
+        filter_param (str): Параметр фильтрации
+        names (list): Заголовки
+    Returns:
+        tuple: Подходящие вакансии и их номера в all_data
+    """
+    data, positions = [], []
+    for position, pers_data in enumerate(all_data):
+        parsed_data = Vacancy(dict(zip(names, pers_data)))
         if parsed_data.filter_condition(filter_param):
             data.append(parsed_data)
-    return sort_vacancies(data, sort_param, reverse_sort_param)
+            positions.append(position)
+    return data, positions
 
 
-def sort_vacancies(all_data, sort_param, reverse_sort_param):
-    """Метод сортировки листа с вакансиями
+def sort_vacancies(all_data, sort_param, reverse_sort_param, limit=None, key_columns=None):
+    """Метод сортировки листа с вакансиями. Параметр сортировки может состоять из нескольких столбцов
+    через запятую. Для каждого столбца один раз за сортировку вычисляется столбец типизированных ключей,
+    если он не передан готовым (DataSet хранит их между запросами),
+    затем выполняется одна лексикографическая сортировка по кортежам ключей.
+    Если для вывода нужно мало первых вакансий, они отбираются кучей без полной сортировки.
+    Порядок, в том числе равных вакансий, совпадает с sorted
     Args:
         all_data (list): Все вакансии
-        sort_param (str): Параметр сортировки
+        sort_param (str): Параметр сортировки, например "Опыт работы, Оклад"
         reverse_sort_param (bool): Обратная сортировка
+        limit (int): Сколько первых вакансий нужно, None если все
+        key_columns (list): Готовые столбцы ключей get_sort_func по каждому столбцу сортировки
     Returns:
         list: Отсортированный или неостсортированный лист с вакансиями
     """
     if sort_param == "":
         return all_data
 
-    return sorted(all_data, key=lambda data: get_sort_func(data, sort_param), reverse=reverse_sort_param)
+    if key_columns is None:
+        key_columns = [[get_sort_func(data, name) for data in all_data] for name in sort_param.split(", ")]
+    keys = key_columns[0] if len(key_columns) == 1 else list(zip(*key_columns))
+    if limit is not None and 0 < limit and limit * 4 < len(all_data):
+        if reverse_sort_param:
+            order = heapq.nlargest(limit, range(len(all_data)), key=keys.__getitem__)
+        else:
+            order = heapq.nsmallest(limit, range(len(all_data)), key=keys.__getitem__)
+    else:
+        order = sorted(range(len(all_data)), key=keys.__getitem__, reverse=reverse_sort_param)
+    return [all_data[index] for index in order]
 
 
 def get_sort_func(data, sort_param):
-    """ Метод сортировки
+    """ Метод получения типизированного ключа сортировки вакансии по одному столбцу
     Args:
         data (Vacancy): Вакансия
         sort_param (str): Параметр сортировки
+    Returns:
+        Ключ сортировки: число для навыков, оклада, даты и опыта, иначе отформатированное значение
     """
     if sort_param == "Навыки":
-        return len(data.key_skills.split("\n"))
+        return skill_index.get_count(data.key_skills)
     elif sort_param == "Оклад":
-        return currency_to_rub[data.salary_currency] * \
-               (float(data.salary_from.replace(" ", "")) + float(data.salary_to.replace(" ", ''))) // 2
+        return currency_to_rub[currency[data.salary_currency]] * (data.salary_from + data.salary_to) // 2
     elif sort_param == "Дата публикации вакансии":
-        return data.full_published_time
+        return data.get_timestamp()
     elif sort_param == "Опыт работы":
-        return experience_sort[data.experience_id]
+        return experience_sort[experience[data.experience_id]]
     else:
-        return data.__getattribute__(translator[sort_param])
+        return data.get_value(translator[sort_param])
+
+
+@functools.lru_cache(maxsize=None)
+def get_date_range(value):
+    """ Метод разбора диапазона дат вида "01.01.2022 - 31.12.2022" или одной даты "01.01.2022"
+    Args:
+        value (str): Диапазон дат
+    Returns:
+        tuple: Первый и последний день диапазона
+    """
+    dates = []
+    for date in value.split(" - "):
+        dates.append(datetime.strptime(date, "%d.%m.%Y").date())
+        if dates[-1].strftime("%d.%m.%Y") != date:
+            raise ValueError(f"Дата {date} должна быть в формате ДД.ММ.ГГГГ")
+    if len(dates) == 1:
+        return dates[0], dates[0]
+    if len(dates) != 2:
+        raise ValueError(f"Диапазон {value} должен состоять из двух дат")
+    return dates[0], dates[1]
 
 
 def parse_html(value):
-    """ Метод отчистки от html
+    """ Метод отчистки от html. Длинные тексты очищаются один раз и берутся из кэша html_cleaner
     Args:
         value (str): Значение
     """
-    result = [" ".join(word.split()) for word in re.sub("<.*?>", "", value).replace("\r\n", "\n").split('\n')]
-    if len(result) == 1:
-        return result[0]
-    return result
+    return html_cleaner.clean(value)
 
 
 def print_vacancies(all_data, distance, columns):
@@ -377,6 +705,19 @@ def print_vacancies(all_data, distance, columns):
     """
     if len(all_data) == 0:
         quick_quit("Ничего не найдено")
+    start, end = get_distance(distance, len(all_data))
+    table = Table()
+    table.print(all_data, start, end, columns)
+
+
+def get_distance(distance, length):
+    """ Метод перевода диапазона вывода в границы среза
+    Args:
+        distance (list): Диапозон вывода
+        length (int): Количество вакансий
+    Returns:
+        tuple: Начало и конец среза
+    """
     if len(distance) >= 1:
         start = int(distance[0]) - 1
     else:
@@ -384,9 +725,60 @@ def print_vacancies(all_data, distance, columns):
     if len(distance) >= 2:
         end = int(distance[1]) - 1
     else:
-        end = len(all_data)
-    table = Table()
-    table.print(all_data, start, end, columns)
+        end = length
+    return start, end
+
+
+def get_limit(distance):
+    """ Метод получения количества первых вакансий, нужных для вывода диапазона
+    Args:
+        distance (list): Диапозон вывода
+    Returns:
+        int: Количество вакансий или None, если нужны все
+    """
+    return int(distance[1]) - 1 if len(distance) >= 2 else None
+
+
+def query_vacancies(dataset, filter_param, sort_param, reverse_sort_param, distance, columns):
+    """ Метод ответа на запрос к уже загруженному набору данных. Индексы и ключи сортировки DataSet строятся
+    при первом запросе и используются всеми следующими
+    Args:
+        dataset (DataSet): Загруженный набор данных
+        filter_param (str): Параметр фильтрации
+        sort_param (str): Параметр сортировки
+        reverse_sort_param (bool): Обратная сортировка
+        distance (list): Диапозон вывода
+        columns (list): Колонки таблицы
+    Returns:
+        str: Таблица или сообщение о том, что ничего не найдено
+    """
+    data = dataset.get_vacancies(filter_param, sort_param, reverse_sort_param, get_limit(distance))
+    if len(data) == 0:
+        return "Ничего не найдено"
+    start, end = get_distance(distance, len(data))
+    return Table().get_string(data, start, end, columns)
+
+
+def page_vacancies(all_data, page_size, columns):
+    """ Метод постраничного вывода вакансий. Следующая страница форматируется только по запросу пользователя
+    Args:
+        all_data (list): Все вакансии
+        page_size (int): Количество вакансий на странице
+        columns (list): Колонки таблицы
+    """
+    if len(all_data) == 0:
+        quick_quit("Ничего не найдено")
+    for start in range(0, len(all_data), page_size):
+        end = min(start + page_size, len(all_data))
+        Table().print(all_data, start, end, columns)
+        if end == len(all_data):
+            break
+        try:
+            answer = input(f"Показано {end} из {len(all_data)}. Enter - следующая страница, q - выход: ")
+        except EOFError:
+            break
+        if answer == "q":
+            break
 
 
 def quick_quit(message):
@@ -405,6 +797,12 @@ def table_create():
     """
     inputed = UserInput()
     dataset = DataSet(inputed.file_name)
-    (names, all_vac_data) = dataset.names, dataset.all_data
-    data = get_vacancies(all_vac_data, inputed.filter_param, inputed.sort_param, inputed.reverse_sort_param, names)
-    print_vacancies(data, inputed.distance_param, inputed.columns_param)
+    try:
+        data = get_vacancies(dataset.select_rows(inputed.filter_param), inputed.filter_param, inputed.sort_param,
+                             inputed.reverse_sort_param, dataset.names, get_limit(inputed.distance_param))
+        if inputed.page_size is None:
+            print_vacancies(data, inputed.distance_param, inputed.columns_param)
+        else:
+            page_vacancies(data, inputed.page_size, inputed.columns_param)
+    finally:
+        html_cleaner.save(inputed.file_name)
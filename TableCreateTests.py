@@ -0,0 +1,254 @@
+import contextlib
+import csv
+import io
+import json
+import os
+import select
+import socket
+import tempfile
+import threading
+from datetime import datetime
+from unittest import TestCase
+from unittest import mock
+
+from HtmlCleaner import HtmlCleaner
+from TableCreate import DataSet
+from TableCreate import Vacancy
+from TableCreate import get_vacancies
+from TableCreate import page_vacancies
+from TableCreate import print_vacancies
+from TableCreate import sort_vacancies
+from TableCreate import table_create
+from data_generator import generate_vacancies
+from table_server import QueryServer, answer, query_lock, serve_stream
+
+
+def vacancy_values(vacancies):
+    return [[getattr(vacancy, name) for name in Vacancy.__slots__] for vacancy in vacancies]
+
+
+class TableCreateTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        file, cls.file_name = tempfile.mkstemp(suffix='.csv')
+        os.close(file)
+        generate_vacancies(cls.file_name, 400, full=True, seed=7, city_count=40)
+        cls.dataset = DataSet(cls.file_name)
+
+    @classmethod
+    def tearDownClass(cls):
+        os.remove(cls.file_name)
+
+    def scan(self, filter_param, sort_param='', reverse_sort_param=False):
+        return get_vacancies(self.dataset.all_data, filter_param, sort_param, reverse_sort_param, self.dataset.names)
+
+
+class IndexTests(TableCreateTestCase):
+    filters = ['Название региона: Москва', 'Название региона: Город 3', 'Компания: ООО "Компания 7"',
+               'Опыт работы: Нет опыта', 'Идентификатор валюты оклада: Доллары', 'Премиум-вакансия: Да',
+               'Название: Программист', 'Название региона: Атлантида', 'Оклад: 100000', 'Навыки: Python, SQL',
+               'Навыки: Git', 'Навыки: COBOL', 'Оклад: 55000.5', 'Дата публикации вакансии: 01.01.2020 - 31.12.2021',
+               'Дата публикации вакансии: 31.12.2021 - 01.01.2020', 'Дата публикации вакансии: 1.1.2020', '']
+
+    def test_same_as_scan(self):
+        for filter_param in self.filters:
+            indexed = get_vacancies(self.dataset.select_rows(filter_param), filter_param, '', False, self.dataset.names)
+            self.assertEqual(vacancy_values(indexed), vacancy_values(self.scan(filter_param)), filter_param)
+
+    def test_publication_day(self):
+        filter_param = f"Дата публикации вакансии: {self.scan('')[0].get_value('published_at')}"
+        indexed = get_vacancies(self.dataset.select_rows(filter_param), filter_param, '', False, self.dataset.names)
+        self.assertEqual(vacancy_values(indexed), vacancy_values(self.scan(filter_param)))
+        self.assertGreater(len(indexed), 0)
+
+    def test_index_is_reused(self):
+        index = self.dataset.get_index('Название региона')
+        self.assertIs(self.dataset.get_index('Название региона'), index)
+        self.assertEqual(sum(len(row_ids) for row_ids in index.values()), len(self.dataset.all_data))
+
+
+class TopTests(TableCreateTestCase):
+    def test_same_as_full_sort(self):
+        vacancies = self.scan('')
+        for sort_param in ['Оклад', 'Опыт работы', 'Премиум-вакансия', 'Навыки', 'Название региона',
+                           'Опыт работы, Навыки, Оклад']:
+            for reverse_sort_param in [False, True]:
+                full = sort_vacancies(vacancies, sort_param, reverse_sort_param)
+                for limit in [1, 5, 20, len(vacancies) + 1]:
+                    top = sort_vacancies(vacancies, sort_param, reverse_sort_param, limit)
+                    self.assertEqual([id(vacancy) for vacancy in top], [id(vacancy) for vacancy in full[:limit]],
+                                     (sort_param, reverse_sort_param, limit))
+
+
+class SortTests(TableCreateTestCase):
+    def test_dates_are_chronological(self):
+        vacancies = self.scan('', 'Дата публикации вакансии')
+        times = [datetime.strptime(vacancy.published_at, '%Y-%m-%dT%H:%M:%S%z') for vacancy in vacancies]
+        self.assertEqual(times, sorted(times))
+
+    def test_multiple_columns(self):
+        vacancies = self.scan('')
+        expected = sorted(vacancies, key=lambda vacancy: (
+            ['Нет опыта', 'От 1 года до 3 лет', 'От 3 до 6 лет', 'Более 6 лет'].index(
+                vacancy.get_value('experience_id')), vacancy.get_value('premium'), vacancy.get_value('name')),
+                          reverse=True)
+        result = self.scan('', 'Опыт работы, Премиум-вакансия, Название', True)
+        self.assertEqual(vacancy_values(result), vacancy_values(expected))
+
+    def test_cached_keys(self):
+        dataset = DataSet(self.file_name)
+        area = dataset.all_data[0][dataset.names.index('area_name')]
+        result = dataset.get_vacancies(f'Название региона: {area}', 'Описание', False)
+        self.assertEqual(vacancy_values(result), vacancy_values(self.scan(f'Название региона: {area}', 'Описание')))
+        self.assertEqual(dataset.sort_keys, {})
+        for filter_param, sort_param, reverse_sort_param in [('', 'Дата публикации вакансии', False),
+                                                             ('Навыки: Git', 'Описание, Оклад', True),
+                                                             ('Название региона: Москва', 'Опыт работы', False)]:
+            for limit in [None, 5]:
+                expected = get_vacancies(dataset.select_rows(filter_param), filter_param, sort_param,
+                                         reverse_sort_param, dataset.names, limit)
+                result = dataset.get_vacancies(filter_param, sort_param, reverse_sort_param, limit)
+                self.assertEqual(vacancy_values(result), vacancy_values(expected))
+        expected = vacancy_values(dataset.get_vacancies('', 'Дата публикации вакансии, Описание', True))
+        with mock.patch('TableCreate.parse_datetime') as parse, mock.patch('TableCreate.parse_html') as clean:
+            result = dataset.get_vacancies('', 'Дата публикации вакансии, Описание', True)
+        self.assertEqual(vacancy_values(result), expected)
+        parse.assert_not_called()
+        clean.assert_not_called()
+
+
+class FormatTests(TableCreateTestCase):
+    def test_get_value(self):
+        vacancy = Vacancy({'name': ' <b>Программист</b>  Python ', 'salary_from': '100000.0', 'salary_to': '150000',
+                           'salary_currency': 'RUR', 'salary_gross': 'True', 'premium': 'False',
+                           'experience_id': 'between1And3', 'key_skills': 'Git\nSQL',
+                           'published_at': '2022-07-05T18:19:30+0300'})
+        self.assertEqual(vacancy.get_value('name'), 'Программист Python')
+        self.assertEqual(vacancy.get_value('salary'), '100 000 - 150 000 (Рубли) (Без вычета налогов)')
+        self.assertEqual(vacancy.get_value('premium'), 'Нет')
+        self.assertEqual(vacancy.get_value('experience_id'), 'От 1 года до 3 лет')
+        self.assertEqual(vacancy.get_value('key_skills'), 'Git\nSQL')
+        self.assertEqual(vacancy.get_value('published_at'), '05.07.2022')
+        self.assertTrue(vacancy.filter_condition('Оклад: 120000'))
+        self.assertTrue(vacancy.filter_condition('Навыки: SQL, Git'))
+        self.assertFalse(vacancy.filter_condition('Премиум-вакансия: Да'))
+
+    def test_extra_column(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, 'vacancies.csv')
+            with open(file_name, 'w', encoding='utf_8_sig', newline='') as file:
+                writer = csv.writer(file)
+                writer.writerow(['id'] + self.dataset.names)
+                writer.writerows([number] + row for number, row in enumerate(self.dataset.all_data))
+            dataset = DataSet(file_name)
+            result = get_vacancies(dataset.all_data, '', 'Оклад', True, dataset.names)
+        self.assertEqual(vacancy_values(result), vacancy_values(self.scan('', 'Оклад', True)))
+
+    def test_window_numbering(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            print_vacancies(self.scan('', 'Оклад', True), ['3', '6'], ['№', 'Название', 'Оклад'])
+        numbers = [line.split('|')[1].strip() for line in output.getvalue().splitlines()[3:] if line.startswith('|')]
+        self.assertEqual([number for number in numbers if number], ['3', '4', '5'])
+
+    def test_pager(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output), mock.patch('builtins.input', side_effect=['', 'q']) as answers:
+            page_vacancies(self.scan(''), 4, ['№', 'Название'])
+        numbers = [line.split('|')[1].strip() for line in output.getvalue().splitlines() if line.startswith('| ')]
+        self.assertEqual([number for number in numbers if number.isdigit()], [str(i) for i in range(1, 9)])
+        self.assertEqual(answers.call_count, 2)
+
+
+class HtmlCleanerTests(TableCreateTestCase):
+    def test_sidecar(self):
+        descriptions = [row[self.dataset.names.index('description')] for row in self.dataset.all_data]
+        cleaner = HtmlCleaner()
+        cleaned = [cleaner.clean(description) for description in descriptions]
+        self.assertEqual(cleaned, [HtmlCleaner.clean_text(description) for description in descriptions])
+        self.assertLess(len(cleaner.cache), len(descriptions))
+        cleaner.save(self.file_name)
+        try:
+            loaded = HtmlCleaner()
+            loaded.load(self.file_name)
+            self.assertEqual(loaded.cache, cleaner.cache)
+            self.assertEqual([loaded.clean(description) for description in descriptions], cleaned)
+            self.assertFalse(loaded.changed)
+        finally:
+            os.remove(HtmlCleaner.get_sidecar(self.file_name))
+
+    def test_unusable_sidecar(self):
+        cleaner = HtmlCleaner(min_length=0)
+        cleaner.clean('<p>Python</p>')
+        cleaner.save(os.path.join(self.file_name, 'missing', 'vacancies.csv'))
+        self.assertTrue(cleaner.changed)
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, 'vacancies.csv')
+            for content in ['[1, 2]', '{"key": 1}', 'not json']:
+                with open(HtmlCleaner.get_sidecar(file_name), 'w', encoding='utf_8') as file:
+                    file.write(content)
+                loaded = HtmlCleaner()
+                loaded.load(file_name)
+                self.assertEqual(loaded.cache, {})
+
+    def test_saved_on_quit(self):
+        inputs = [self.file_name, 'Название региона: Нигде', '', '', '', '']
+        with mock.patch('builtins.input', side_effect=inputs), mock.patch('TableCreate.html_cleaner') as cleaner, \
+                contextlib.redirect_stdout(io.StringIO()) as output, self.assertRaises(SystemExit):
+            table_create()
+        self.assertEqual(output.getvalue(), 'Ничего не найдено\n')
+        cleaner.save.assert_called_once_with(self.file_name)
+
+
+class ServerTests(TableCreateTestCase):
+    request = {'filter': 'Навыки: Git', 'sort': 'Оклад', 'reverse': True, 'range': '2 6', 'columns': 'Название, Оклад'}
+
+    def expected_table(self):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            print_vacancies(self.scan('Навыки: Git', 'Оклад', True), ['2', '6'], ['№', 'Название', 'Оклад'])
+        return output.getvalue().rstrip('\n')
+
+    def test_answer(self):
+        self.assertEqual(answer(self.dataset, self.request), {'table': self.expected_table()})
+        self.assertEqual(answer(self.dataset, {'filter': 'Город: Москва'}), {'error': 'Параметр поиска некорректен'})
+        self.assertIn('error', answer(self.dataset, {'filter': 'Дата публикации вакансии: 1 - 2'}))
+        self.assertEqual(answer(self.dataset, {'filter': 'Навыки: COBOL'}), {'table': 'Ничего не найдено'})
+
+    def test_stream(self):
+        output = io.StringIO()
+        serve_stream(self.dataset, io.StringIO(json.dumps(self.request) + '\n\n{oops\n'), output)
+        responses = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual(responses[0], {'table': self.expected_table()})
+        self.assertIn('error', responses[1])
+
+    def test_socket(self):
+        with QueryServer(self.dataset, 0) as server:
+            thread = threading.Thread(target=server.serve_forever)
+            thread.start()
+            try:
+                with socket.create_connection(server.server_address) as connection, \
+                        connection.makefile('rw', encoding='utf_8') as file:
+                    for _ in range(2):
+                        file.write(json.dumps(self.request) + '\n')
+                        file.flush()
+                        self.assertEqual(json.loads(file.readline()), {'table': self.expected_table()})
+            finally:
+                server.shutdown()
+                thread.join()
+
+    def test_socket_queries_serialized(self):
+        with QueryServer(self.dataset, 0) as server:
+            thread = threading.Thread(target=server.serve_forever)
+            thread.start()
+            try:
+                with socket.create_connection(server.server_address) as connection, \
+                        connection.makefile('rw', encoding='utf_8') as file:
+                    with query_lock:
+                        file.write(json.dumps(self.request) + '\n')
+                        file.flush()
+                        self.assertEqual(select.select([connection], [], [], 0.3)[0], [])
+                    self.assertEqual(json.loads(file.readline()), {'table': self.expected_table()})
+            finally:
+                server.shutdown()
+                thread.join()
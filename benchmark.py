@@ -0,0 +1,226 @@
+import argparse
+import builtins
+import csv
+import json
+import os
+import runpy
+import shutil
+import signal
+import subprocess
+import sys
+import time
+
+from data_generator import generate_exchange_rates, generate_vacancies
+
+repository = os.path.dirname(os.path.abspath(__file__))
+
+# Путь, прописанный в ConcurrentFutures.py и multiprocessing_program.py
+start_data = 'startData\\vacancies_by_year.csv'
+
+profession = 'Программист'
+
+
+def run_pdf_create(engine):
+    """ Метод для последовательного анализа PdfCreate выбранным движком
+
+    Args:
+        engine (str): Движок анализа данных
+    """
+    from PdfCreate import Vacancy, csv_stream, engines
+    engines[engine]().get_data((Vacancy(i) for i in csv_stream('vacancies.csv')), profession)
+
+
+def run_pdf_create_parallel():
+    """ Метод для параллельного анализа PdfCreate
+    """
+    from PdfCreate import parallel_get_data
+    parallel_get_data('vacancies.csv', profession)
+
+
+def run_user_data(module_name):
+    """ Метод для запуска user_data из ConcurrentFutures.py или multiprocessing_program.py
+
+    Args:
+        module_name (str): Название модуля
+    """
+    module = __import__(module_name)
+    module.user_data('vacancies_by_year', profession)
+
+
+def run_script(path, *answers):
+    """ Метод для запуска скрипта как основной программы с заранее заданными ответами на input
+
+    Args:
+        path (str): Путь к скрипту относительно репозитория
+        *answers (str): Ответы на запросы ввода
+    """
+    answers = iter(answers)
+    builtins.input = lambda prompt='': next(answers)
+    runpy.run_path(os.path.join(repository, path), run_name='__main__')
+
+
+def run_report_script(path, *answers):
+    """ Метод для запуска скрипта отчёта из 3.4.x. Шаблон скрипта копируется в рабочую папку,
+    а pdf не рендерится: wkhtmltopdf - внешняя программа, и остальные цели тоже замеряют только анализ
+
+    Args:
+        path (str): Путь к скрипту относительно репозитория
+        *answers (str): Ответы на запросы ввода
+    """
+    import pdfkit
+    shutil.copyfile(os.path.join(repository, os.path.dirname(path), 'pdf_template.html'), 'pdf_template.html')
+    pdfkit.configuration = lambda **kwargs: None
+    pdfkit.from_string = lambda *args, **kwargs: True
+    run_script(path, *answers)
+
+
+def run_table_create():
+    """ Метод для фильтрации, сортировки и вывода первых 20 вакансий тем же путём, что и table_create:
+    отбор по индексу, сортировка отобранных и форматирование только выводимых вакансий
+    """
+    from TableCreate import DataSet, Table, UserInput, get_distance, get_limit, get_vacancies
+    dataset = DataSet('vacancies_full.csv')
+    filter_param, distance = 'Название региона: Москва', ['1', '21']
+    data = get_vacancies(dataset.select_rows(filter_param), filter_param, 'Оклад', True, dataset.names,
+                         get_limit(distance))
+    Table().get_string(data, *get_distance(distance, len(data)), UserInput.check_names(['']))
+
+
+targets = {
+    'PdfCreate (python)': lambda: run_pdf_create('python'),
+    'PdfCreate (numpy)': lambda: run_pdf_create('numpy'),
+    'PdfCreate (parallel)': run_pdf_create_parallel,
+    'ConcurrentFutures': lambda: run_user_data('ConcurrentFutures'),
+    'multiprocessing_program': lambda: run_user_data('multiprocessing_program'),
+    '3.4.2 PdfCreateAnalyst': lambda: run_report_script('3.4.2/PdfCreateAnalyst.py', 'vacancies.csv', profession),
+    '3.4.3 PdfCreateAnalystMore': lambda: run_report_script('3.4.3/PdfCreateAnalystMore.py', 'vacancies.csv',
+                                                            profession, 'Москва'),
+    '3.5.1 SQLite rates': lambda: run_script('3.5.1/data_base_3.5.1.py'),
+    '3.5.2 SQLite convert': lambda: run_script('3.5.2/data_base_3.5.2.py'),
+    '3.5.3 SQLite analytics': lambda: run_script('3.5.3/data_base_3.5.3.py', profession),
+    'TableCreate': run_table_create,
+}
+
+
+def prepare(work_dir, rows, seed):
+    """ Метод для подготовки рабочей папки с синтетическими данными для всех программ
+
+    Args:
+        work_dir (str): Рабочая папка
+        rows (int): Количество вакансий
+        seed (int): Зерно генератора случайных чисел
+    """
+    os.makedirs(work_dir, exist_ok=True)
+    os.chdir(work_dir)
+    generate_vacancies('vacancies.csv', rows, seed=seed)
+    generate_vacancies('vacancies_full.csv', max(rows // 10, 1), full=True, seed=seed)
+    generate_exchange_rates('exchange_rate_currency.csv', seed=seed)
+    shutil.copyfile('vacancies.csv', 'vacancies_dif_currencies.csv')
+    os.makedirs(os.path.dirname(start_data) or '.', exist_ok=True)
+    shutil.copyfile('vacancies.csv', start_data)
+    os.makedirs('csv_data', exist_ok=True)
+    shutil.rmtree('vacancies_by_year', ignore_errors=True)
+    os.makedirs('vacancies_by_year')
+    files = {}
+    with open('vacancies.csv', encoding='utf_8_sig') as file:
+        reader = csv.reader(file)
+        headers = next(reader)
+        for row in reader:
+            year = row[5][:4]
+            if year not in files:
+                files[year] = open(os.path.join('vacancies_by_year', f'{year}.csv'), 'w', encoding='utf_8_sig',
+                                   newline='')
+                csv.writer(files[year]).writerow(headers)
+            csv.writer(files[year]).writerow(row)
+    for file in files.values():
+        file.close()
+
+
+def run_target(name):
+    """ Метод для запуска одной программы в текущем процессе и вывода результата замера в формате JSON
+
+    Args:
+        name (str): Название программы из targets
+    """
+    sys.path.insert(0, repository)
+    error = None
+    start = time.perf_counter()
+    try:
+        targets[name]()
+    except BaseException as exception:
+        error = f'{type(exception).__name__}: {exception}'
+    seconds = time.perf_counter() - start
+    memory = None
+    try:
+        import resource
+        memory = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                     resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    except ImportError:
+        pass
+    sys.__stdout__.write('\n' + json.dumps({'seconds': seconds, 'max_rss_kb': memory, 'error': error}) + '\n')
+
+
+def run_process(name, work_dir, timeout):
+    """ Метод для запуска одной программы в отдельном процессе интерпретатора.
+    Процесс запускается в своей группе, чтобы по таймауту завершить его вместе с дочерними процессами
+
+    Args:
+        name (str): Название программы из targets
+        work_dir (str): Рабочая папка
+        timeout (float): Максимальное время работы в секундах
+
+    Returns:
+        dict: Результат замера из run_target
+    """
+    process = subprocess.Popen([sys.executable, os.path.join(repository, 'benchmark.py'), '--target', name],
+                               cwd=work_dir, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                               stderr=subprocess.DEVNULL, text=True, start_new_session=True)
+    try:
+        output = process.communicate(timeout=timeout)[0]
+    except subprocess.TimeoutExpired:
+        if hasattr(os, 'killpg'):
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+        process.communicate()
+        return {'seconds': timeout, 'max_rss_kb': None, 'error': f'TimeoutExpired: дольше {timeout:g} с'}
+    lines = output.strip().splitlines()
+    if len(lines) == 0:
+        return {'seconds': 0, 'max_rss_kb': None, 'error': f'процесс завершился с кодом {process.returncode}'}
+    return json.loads(lines[-1])
+
+
+def benchmark(work_dir, rows, names, seed=42, timeout=600):
+    """ Метод для замера времени и пиковой памяти всех программ на одних и тех же данных.
+    Каждая программа запускается в отдельном процессе интерпретатора
+
+    Args:
+        work_dir (str): Рабочая папка
+        rows (int): Количество вакансий
+        names (list): Названия программ из targets
+        seed (int): Зерно генератора случайных чисел
+        timeout (float): Максимальное время работы одной программы в секундах
+    """
+    start = time.perf_counter()
+    prepare(work_dir, rows, seed)
+    print(f'Данные: {rows} вакансий, {time.perf_counter() - start:.1f} с')
+    for name in names:
+        result = run_process(name, work_dir, timeout)
+        memory = f"{result['max_rss_kb'] / 1024:.0f} МБ" if result['max_rss_kb'] else '-'
+        print(f"{name}: {result['seconds']:.2f} с, пиковая память {memory}"
+              f"{', ошибка ' + result['error'] if result['error'] else ''}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Замер программ на синтетических данных о вакансиях')
+    parser.add_argument('rows', type=int, nargs='?', default=1000000)
+    parser.add_argument('--work-dir', default='benchmark_data')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--timeout', type=float, default=600)
+    parser.add_argument('--only', nargs='*', default=list(targets), choices=list(targets))
+    parser.add_argument('--target', choices=list(targets))
+    args = parser.parse_args()
+    if args.target:
+        run_target(args.target)
+    else:
+        benchmark(os.path.abspath(args.work_dir), args.rows, args.only, args.seed, args.timeout)
@@ -0,0 +1,204 @@
+import csv
+import math
+import random
+import sys
+
+short_headers = ['name', 'salary_from', 'salary_to', 'salary_currency', 'area_name', 'published_at']
+
+full_headers = ['name', 'description', 'key_skills', 'experience_id', 'premium', 'employer_name', 'salary_from',
+                'salary_to', 'salary_gross', 'salary_currency', 'area_name', 'published_at']
+
+professions = ['Программист', 'Разработчик', 'Аналитик', 'Тестировщик', 'Системный администратор', 'Менеджер проектов',
+               'Дизайнер', 'Инженер', 'Бухгалтер', 'Специалист технической поддержки', 'Java-разработчик',
+               'Python-разработчик', 'Frontend developer', 'Backend developer', 'DevOps-инженер', 'Data Scientist',
+               '1С программист', 'Оператор call-центра', 'Менеджер по продажам', 'Web-программист']
+
+profession_modifiers = ['', '', '', 'Старший ', 'Ведущий ', 'Младший ', 'Junior ', 'Senior ', 'Стажер ']
+
+# Вес валюты и множитель для перевода медианной зарплаты в рублях в эту валюту
+currencies = {
+    'RUR': (0.93, 1),
+    'USD': (0.025, 1 / 60.66),
+    'EUR': (0.012, 1 / 59.90),
+    'KZT': (0.012, 1 / 0.13),
+    'UAH': (0.008, 1 / 1.64),
+    'BYR': (0.007, 1 / 23.91),
+    'AZN': (0.002, 1 / 35.68),
+    'UZS': (0.002, 1 / 0.0055),
+    'KGS': (0.001, 1 / 0.76),
+    'GEL': (0.001, 1 / 21.74),
+}
+
+big_cities = ['Москва', 'Санкт-Петербург', 'Новосибирск', 'Екатеринбург', 'Казань', 'Нижний Новгород', 'Краснодар',
+              'Самара', 'Ростов-на-Дону', 'Минск', 'Алматы', 'Киев', 'Воронеж', 'Уфа', 'Пермь', 'Челябинск', 'Омск',
+              'Красноярск', 'Тюмень', 'Ташкент', 'Баку', 'Тбилиси', 'Бишкек', 'Ярославль', 'Томск']
+
+experience_ids = ['noExperience', 'between1And3', 'between3And6', 'moreThan6']
+
+skills = ['Python', 'Java', 'SQL', 'Git', 'Linux', 'Docker', 'JavaScript', 'HTML', 'CSS', 'React', 'Django', '1С',
+          'Английский язык', 'Работа в команде', 'PostgreSQL', 'Kubernetes', 'C++', 'C#', 'MS Excel', 'Переговоры',
+          'Деловая переписка', 'Photoshop', 'Figma', 'ООП', 'REST API', 'TypeScript', 'Kotlin', 'Go', 'PHP', 'Jira']
+
+employers = [f'ООО "Компания {index}"' for index in range(1, 3001)]
+
+
+def get_city_weights(city_count):
+    """ Метод для получения списка городов и их весов: Москва 33%, Санкт-Петербург 12%,
+    остальные крупные города 30% и длинный хвост мелких городов 25%, внутри групп по закону Ципфа
+
+    Args:
+        city_count (int): Общее количество городов
+
+    Returns:
+        tuple: Список городов и список весов
+    """
+    tail_cities = [f'Город {index}' for index in range(1, max(city_count - len(big_cities), 0) + 1)]
+    big_weights = [1 / rank ** 1.1 for rank in range(1, len(big_cities) - 1)]
+    tail_weights = [1 / rank ** 1.1 for rank in range(1, len(tail_cities) + 1)]
+    weights = [0.33, 0.12] + [0.3 * weight / sum(big_weights) for weight in big_weights] + \
+              [0.25 * weight / sum(tail_weights) for weight in tail_weights]
+    return big_cities + tail_cities, weights
+
+
+def get_year_weights(first_year, last_year):
+    """ Метод для получения весов годов публикации: число вакансий растёт примерно на 12% в год
+
+    Args:
+        first_year (int): Первый год
+        last_year (int): Последний год
+
+    Returns:
+        tuple: Список годов и список весов
+    """
+    years = list(range(first_year, last_year + 1))
+    return years, [1.12 ** (year - first_year) for year in years]
+
+
+def get_offset(year):
+    """ Метод для получения часового пояса Москвы в указанный год
+
+    Args:
+        year (int): Год
+
+    Returns:
+        str: Смещение от UTC
+    """
+    return '+0400' if 2011 <= year <= 2014 else '+0300'
+
+
+def generate_description(generator, name, vacancy_skills):
+    """ Метод для генерации html-описания вакансии
+
+    Args:
+        generator (random.Random): Генератор случайных чисел
+        name (str): Название вакансии
+        vacancy_skills (list): Навыки вакансии
+
+    Returns:
+        str: Описание вакансии
+    """
+    paragraphs = [f'<p><strong>{name}</strong> в команду разработки.</p>',
+                  '<p>Обязанности:</p><ul>' + ''.join(f'<li>работа с {skill}</li>' for skill in vacancy_skills) +
+                  '</ul>']
+    for _ in range(generator.randint(1, 20)):
+        paragraphs.append('<p>Мы предлагаем  стабильную  заработную плату, ДМС, гибкий график и '
+                          'профессиональное развитие.</p>\r\n')
+    return ''.join(paragraphs)
+
+
+def generate_rows(rows, full=False, seed=42, city_count=2000, first_year=2003, last_year=2022, batch_size=10000):
+    """ Метод для генерации строк вакансий пачками, не храня в памяти весь набор данных
+
+    Args:
+        rows (int): Количество строк
+        full (bool): Генерировать схему TableCreate (с описанием, навыками и html) вместо схемы PdfCreate
+        seed (int): Зерно генератора случайных чисел
+        city_count (int): Количество городов
+        first_year (int): Первый год публикации
+        last_year (int): Последний год публикации
+        batch_size (int): Размер пачки строк
+
+    Yields:
+        list: Строка вакансии
+    """
+    generator = random.Random(seed)
+    cities, city_weights = get_city_weights(city_count)
+    years, year_weights = get_year_weights(first_year, last_year)
+    currency_names = list(currencies)
+    currency_weights = [currencies[name][0] for name in currency_names]
+    descriptions = {}
+    while rows > 0:
+        size = min(batch_size, rows)
+        rows -= size
+        batch_names = generator.choices(professions, k=size)
+        batch_cities = generator.choices(cities, weights=city_weights, k=size)
+        batch_years = generator.choices(years, weights=year_weights, k=size)
+        batch_currencies = generator.choices(currency_names, weights=currency_weights, k=size)
+        for name, city, year, currency in zip(batch_names, batch_cities, batch_years, batch_currencies):
+            name = generator.choice(profession_modifiers) + name
+            median = 25000 * 1.08 ** (year - first_year) * currencies[currency][1]
+            salary_from = round(median * math.exp(generator.gauss(0, 0.45)), -2)
+            salary_to = round(salary_from * generator.uniform(1.1, 1.8), -2)
+            salary_from = '' if generator.random() < 0.15 else f'{salary_from:.1f}'
+            salary_to = '' if generator.random() < 0.25 else f'{salary_to:.1f}'
+            published_at = f'{year}-{generator.randint(1, 12):02}-{generator.randint(1, 28):02}T' \
+                           f'{generator.randint(0, 23):02}:{generator.randint(0, 59):02}:' \
+                           f'{generator.randint(0, 59):02}{get_offset(year)}'
+            if not full:
+                yield [name, salary_from, salary_to, currency, city, published_at]
+                continue
+            vacancy_skills = generator.sample(skills, generator.randint(0, 8))
+            description_key = (name, tuple(vacancy_skills[:2]))
+            description = descriptions.get(description_key)
+            if description is None:
+                description = descriptions[description_key] = generate_description(generator, name,
+                                                                                   vacancy_skills[:2])
+            yield [name, description, '\n'.join(vacancy_skills), generator.choice(experience_ids),
+                   generator.choice(['False', 'False', 'False', 'True']), generator.choice(employers),
+                   salary_from, salary_to, generator.choice(['False', 'True']), currency, city, published_at]
+
+
+def generate_vacancies(file_name, rows, full=False, seed=42, **kwargs):
+    """ Метод для записи синтетического набора вакансий в файл формата .csv
+
+    Args:
+        file_name (str): Имя создаваемого файла
+        rows (int): Количество строк
+        full (bool): Генерировать схему TableCreate вместо схемы PdfCreate
+        seed (int): Зерно генератора случайных чисел
+        **kwargs: Параметры generate_rows
+    """
+    with open(file_name, 'w', encoding='utf_8_sig', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(full_headers if full else short_headers)
+        batch = []
+        for row in generate_rows(rows, full, seed, **kwargs):
+            batch.append(row)
+            if len(batch) == 10000:
+                writer.writerows(batch)
+                batch = []
+        writer.writerows(batch)
+
+
+def generate_exchange_rates(file_name, first_year=2003, last_year=2022, seed=42):
+    """ Метод для записи синтетических курсов валют по месяцам в формате exchange_rate_currency.csv
+
+    Args:
+        file_name (str): Имя создаваемого файла
+        first_year (int): Первый год
+        last_year (int): Последний год
+        seed (int): Зерно генератора случайных чисел
+    """
+    generator = random.Random(seed)
+    currency_names = sorted(name for name in currencies if name != 'RUR')
+    with open(file_name, 'w', encoding='utf_8', newline='') as file:
+        writer = csv.writer(file)
+        writer.writerow(['date'] + currency_names)
+        for year in range(first_year, last_year + 1):
+            for month in range(1, 13):
+                writer.writerow([f'{year}-{month:02}'] + [
+                    round(1 / currencies[name][1] * generator.uniform(0.8, 1.2), 4) for name in currency_names])
+
+
+if __name__ == '__main__':
+    generate_vacancies(sys.argv[1], int(sys.argv[2]), full=len(sys.argv) > 3 and sys.argv[3] == 'full')
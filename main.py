@@ -1,5 +1,19 @@
-import PdfCreate
-import TableCreate
+def load_subsystem(input_person):
+    """ Метод для загрузки только той части программы, которую выбрал пользователь
+
+    Args:
+        input_person (str): Выбранный формат таблицы(Вакансии/Статистика)
+
+    Returns:
+        function: Функция создания pdf файла или таблицы в консоли, None если формат не корректен
+    """
+    if input_person == "Статистика":
+        import PdfCreate
+        return PdfCreate.pdf_create
+    elif input_person == "Вакансии":
+        import TableCreate
+        return TableCreate.table_create
+    return None
 
 
 def Creator():
@@ -9,14 +23,12 @@ def Creator():
         pdf файл или таблица в консоли в зависимости от выбора пользователя
     """
     input_person = input("Введите формат таблицы(Вакансии/Статистика): ")
-    if input_person == "Статистика":
-        PdfCreate.pdf_create()
-    elif input_person == "Вакансии":
-        TableCreate.table_create()
-        # TableCreate.table_create(223)
-    else:
+    creator = load_subsystem(input_person)
+    if creator is None:
         print("Данные не корректны")
         exit()
+    creator()
 
 
-Creator()
+if __name__ == '__main__':
+    Creator()
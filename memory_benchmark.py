@@ -0,0 +1,71 @@
+import os
+import sys
+import tempfile
+import tracemalloc
+from types import SimpleNamespace
+
+from TableCreate import DataSet, Vacancy
+from data_generator import generate_vacancies
+
+
+def dict_vacancy(pers_data):
+    """ Метод для создания вакансии с теми же полями, но со словарём атрибутов, как у обычного объекта
+
+    Args:
+        pers_data (dict): Данные вакансии
+
+    Returns:
+        SimpleNamespace: Вакансия
+    """
+    vacancy = SimpleNamespace()
+    for key, value in pers_data.items():
+        if key == "salary_from" or key == "salary_to":
+            value = int(float(value))
+        setattr(vacancy, key, value)
+    return vacancy
+
+
+def measure(create, dataset):
+    """ Метод для замера памяти, занимаемой вакансиями всего файла
+
+    Args:
+        create (function): Функция создания вакансии из словаря полей
+        dataset (DataSet): Прочитанный файл
+
+    Returns:
+        int: Размер вакансий в байтах без учёта строк, общих с прочитанным файлом
+    """
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    vacancies = [create(dict(zip(dataset.names, row))) for row in dataset.all_data]
+    size = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    del vacancies
+    return size
+
+
+def memory_benchmark(file_name):
+    """ Метод для вывода памяти, занимаемой вакансиями TableCreate в компактном и словарном виде
+
+    Args:
+        file_name (str): Название файла
+    """
+    dataset = DataSet(file_name)
+    count = len(dataset.all_data)
+    for name, create in [("Vacancy (__slots__)", Vacancy), ("Словарь атрибутов", dict_vacancy)]:
+        size = measure(create, dataset)
+        print(f"{name}: {size / 1024 / 1024:.1f} МБ на {count} вакансий, {size / count:.0f} байт на вакансию, "
+              f"{size / count * 1000000 / 1024 / 1024 / 1024:.2f} ГБ на миллион")
+
+
+if __name__ == '__main__':
+    if len(sys.argv) > 1 and not sys.argv[1].isdigit():
+        memory_benchmark(sys.argv[1])
+    else:
+        file, temp_name = tempfile.mkstemp(suffix='.csv')
+        os.close(file)
+        try:
+            generate_vacancies(temp_name, int(sys.argv[1]) if len(sys.argv) > 1 else 100000, full=True)
+            memory_benchmark(temp_name)
+        finally:
+            os.remove(temp_name)
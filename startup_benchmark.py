@@ -0,0 +1,55 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+heavy_modules = ['matplotlib', 'numpy', 'openpyxl', 'pdfkit', 'jinja2', 'pandas', 'prettytable']
+
+probe = """
+import json, sys, time
+start = time.perf_counter()
+import main
+main.load_subsystem({branch!r})
+seconds = time.perf_counter() - start
+print(json.dumps({{'seconds': seconds, 'modules': [name for name in {heavy_modules!r} if name in sys.modules]}}))
+"""
+
+
+def measure_branch(branch, runs):
+    """ Метод для замера времени запуска ветки меню в новых процессах интерпретатора
+
+    Args:
+        branch (str): Ветка меню (Вакансии/Статистика)
+        runs (int): Количество запусков
+
+    Returns:
+        dict: Медиана, минимум и максимум времени запуска в секундах и загруженные тяжёлые модули
+    """
+    directory = os.path.dirname(os.path.abspath(__file__))
+    code = probe.format(branch=branch, heavy_modules=heavy_modules)
+    results = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', code], cwd=directory, capture_output=True, text=True,
+                                check=True, env={**os.environ, 'PYTHONDONTWRITEBYTECODE': '1'}).stdout
+        results.append(json.loads(output))
+    seconds = [result['seconds'] for result in results]
+    return {'median': statistics.median(seconds), 'min': min(seconds), 'max': max(seconds),
+            'modules': results[0]['modules']}
+
+
+def startup_benchmark(runs=15):
+    """ Метод для вывода времени запуска обеих веток меню main.py
+
+    Args:
+        runs (int): Количество запусков каждой ветки
+    """
+    for branch in ["Вакансии", "Статистика"]:
+        result = measure_branch(branch, runs)
+        print(f"{branch}: медиана {result['median'] * 1000:.1f} мс, "
+              f"мин {result['min'] * 1000:.1f} мс, макс {result['max'] * 1000:.1f} мс, "
+              f"тяжёлые модули: {', '.join(result['modules']) or 'нет'}")
+
+
+if __name__ == '__main__':
+    startup_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 15)
@@ -0,0 +1,149 @@
+import argparse
+import json
+import socketserver
+import sys
+import threading
+
+from TableCreate import DataSet, UserInput, get_date_range, html_cleaner, query_vacancies
+
+# Индексы DataSet, словарь навыков и кэш html_cleaner строятся лениво и без блокировок,
+# поэтому запросы из разных соединений выполняются по одному
+query_lock = threading.Lock()
+
+
+def answer(dataset, request):
+    """ Метод ответа на один запрос в формате JSON.
+    Запрос: {"filter": "Навыки: Git", "sort": "Оклад", "reverse": true, "range": "1 20", "columns": "Название, Оклад"},
+    все поля необязательны. Ответ: {"table": "..."} или {"error": "..."}
+
+    Args:
+        dataset (DataSet): Загруженный набор данных
+        request (dict): Запрос
+
+    Returns:
+        dict: Ответ
+    """
+    try:
+        filter_param = request.get("filter", "")
+        sort_param = request.get("sort", "")
+        distance = request.get("range", [])
+        columns = request.get("columns", "")
+        if filter_param != "" and (": " not in filter_param or filter_param.split(": ")[0] not in
+                                   UserInput.sort_phrases):
+            return {"error": "Параметр поиска некорректен"}
+        if filter_param.startswith("Дата публикации вакансии: ") and " - " in filter_param:
+            get_date_range(filter_param.split(": ")[1])
+        if sort_param != "" and any(name not in UserInput.sort_phrases for name in sort_param.split(", ")):
+            return {"error": "Параметр сортировки некорректен"}
+        if type(distance) == str:
+            distance = distance.split()
+        if type(columns) == str:
+            columns = columns.split(", ")
+        table = query_vacancies(dataset, filter_param, sort_param, bool(request.get("reverse", False)),
+                                [str(value) for value in distance], UserInput.check_names(list(columns)))
+    except (ValueError, KeyError, TypeError, AttributeError) as error:
+        return {"error": str(error)}
+    return {"table": table}
+
+
+def answer_line(dataset, line):
+    """ Метод ответа на строку протокола: одна строка - один JSON-запрос
+
+    Args:
+        dataset (DataSet): Загруженный набор данных
+        line (str): Строка запроса
+
+    Returns:
+        str: Строка ответа
+    """
+    try:
+        request = json.loads(line)
+    except json.JSONDecodeError as error:
+        return json.dumps({"error": f"Некорректный JSON: {error}"}, ensure_ascii=False)
+    if type(request) != dict:
+        return json.dumps({"error": "Запрос должен быть объектом JSON"}, ensure_ascii=False)
+    return json.dumps(answer(dataset, request), ensure_ascii=False)
+
+
+def serve_stream(dataset, input_stream, output_stream):
+    """ Метод обработки запросов из потока, пока он не закончится
+
+    Args:
+        dataset (DataSet): Загруженный набор данных
+        input_stream (file): Поток запросов
+        output_stream (file): Поток ответов
+    """
+    for line in input_stream:
+        if line.strip() == "":
+            continue
+        output_stream.write(answer_line(dataset, line) + "\n")
+        output_stream.flush()
+
+
+class QueryHandler(socketserver.StreamRequestHandler):
+    """ Класс обработки одного соединения: запросы и ответы по строкам JSON
+    """
+    def handle(self):
+        """ Отвечает на запросы соединения, пока клиент его не закроет
+        """
+        for line in self.rfile:
+            line = line.decode("utf_8")
+            if line.strip() == "":
+                continue
+            with query_lock:
+                response = answer_line(self.server.dataset, line)
+            self.wfile.write((response + "\n").encode("utf_8"))
+
+
+class QueryServer(socketserver.ThreadingTCPServer):
+    """ Класс локального сервера запросов к одному загруженному набору данных.
+    Каждое соединение обслуживается в своём потоке, набор данных и индексы общие,
+    сами запросы выполняются по одному под query_lock
+
+    Attributes:
+        dataset (DataSet): Загруженный набор данных
+    """
+    allow_reuse_address = True
+    daemon_threads = True
+
+    def __init__(self, dataset, port, host="127.0.0.1"):
+        """ Инициализирует объекты QueryServer
+
+        Args:
+            dataset (DataSet): Загруженный набор данных
+            port (int): Порт, 0 - любой свободный
+            host (str): Адрес
+        """
+        super().__init__((host, port), QueryHandler)
+        self.dataset = dataset
+
+
+def table_server(file_name, port=None):
+    """ Метод запуска сервера: файл читается один раз, дальше запросы принимаются
+    из стандартного ввода или по TCP, если указан порт
+
+    Args:
+        file_name (str): Название файла
+        port (int): Порт или None для работы через стандартный ввод
+    """
+    dataset = DataSet(file_name)
+    try:
+        if port is None:
+            serve_stream(dataset, sys.stdin, sys.stdout)
+        else:
+            with QueryServer(dataset, port) as server:
+                print(f"Сервер запущен на 127.0.0.1:{server.server_address[1]}", file=sys.stderr)
+                server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        with query_lock:
+            html_cleaner.save(file_name)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Сервер запросов к таблице вакансий')
+    parser.add_argument('file_name')
+    parser.add_argument('--port', type=int)
+    args = parser.parse_args()
+    table_server(args.file_name, args.port)